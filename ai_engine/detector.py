@@ -7,27 +7,58 @@ from ai_engine.logic.sleep_detector import SleepDetector
 from ai_engine.logic.sleep_pose_detector import SleepPoseDetector
 from ai_engine.logic.phone_detector import PhoneDetector
 from ai_engine.logic.away_detector import AwayDetector
+from ai_engine.logic.tracker import ObjectTracker
+from ai_engine.logic.activity_controller import ActivityController
+from ai_engine.logic.voting import VoteBuffer
+from ai_engine.logic.landmark_state import LandmarkState
+from ai_engine.frame_pool import FramePool
+from ai_engine.evidence import EvidenceRecorder
+from ai_engine.runtime_settings import resolve_settings, VOTE_WINDOWS, MIN_VOTES
+from ai_engine.tracing import FrameTracer
 
 from backend.services.event_logger import EventLogger
+from backend.config import EVIDENCE_DIR, EVIDENCE_MAX_BYTES, DEFAULT_PROFILE
+from backend.services.metrics import metrics
 
 # Load YOLO model (COCO pretrained)
 model = YOLO("yolov8n.pt")
 
 
 class DetectionRunner:
-    def __init__(self, show_preview=True):
+    def __init__(self, show_preview=True, use_buffer_pool=True, save_evidence=True,
+                 annotate_evidence=True, profile=DEFAULT_PROFILE):
         self.running = False
         self.cap = None
         self.show_preview = show_preview
         self.frame_count = 0
         self.current_alerts = []
 
-        # Accuracy improvements - slower but more accurate
-        self.detection_interval = 3  # Process every 3 frames (was every frame)
-        self.confirmation_frames = 5  # Need 5 consecutive detections to confirm
-        self.sleep_buffer = []
-        self.phone_buffer = []
-        self.away_buffer = []
+        # Buffer pool mode - reuse capture/RGB arrays instead of allocating per frame
+        self.pool = FramePool() if use_buffer_pool else None
+        self.text_sizes = {}  # Cached cv2.getTextSize results for repeated labels
+
+        # Evidence snapshots on sleep/phone/away start
+        self.save_evidence = save_evidence
+        self.annotate_evidence = annotate_evidence  # Include boxes/alerts drawn on the frame
+        self.evidence = None
+        self.pending_evidence = []  # Reserved snapshot paths for the current frame
+        self.current_frame = None
+
+        # Performance profile - every tunable knob, swappable while running
+        self.profile = profile
+        self.settings = resolve_settings(profile)
+        self.pending_settings = None  # (profile, settings) applied at the next frame
+        self.settings_lock = threading.Lock()
+
+        self.yolo_interval = self.settings["yolo_interval"]  # Run YOLO every N frames, tracker fills the gaps
+        self.yolo_conf = self.settings["yolo_conf"]
+
+        # Opt-in stage tracing, toggled through /admin/trace
+        self.tracer = FrameTracer()
+
+        # FPS reporting
+        self.fps_window_start = time.time()
+        self.fps_window_frames = 0
 
     def start(self):
         """Start detection in a separate thread"""
@@ -43,165 +74,355 @@ class DetectionRunner:
             self.running = False
             return
 
-        # Set camera properties for better quality
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
-        self.cap.set(cv2.CAP_PROP_FPS, 30)
+        # Set camera properties from the active profile
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.settings["capture_width"])
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.settings["capture_height"])
+        self.cap.set(cv2.CAP_PROP_FPS, self.settings["capture_fps"])
 
         # Initialize detectors
-        self.sleep_detector = SleepDetector()
+        self.sleep_detector = SleepDetector(eye_window=VOTE_WINDOWS["sleep_eyes"])
         self.sleep_detector.setup()
         self.sleep_pose_detector = SleepPoseDetector()
         self.phone_detector = PhoneDetector()
         self.away_detector = AwayDetector()
+        self.tracker = ObjectTracker()
+        self.landmarks = LandmarkState(full_rate_hz=self.settings["landmark_full_rate_hz"])
 
         # Event logger (removed socket emissions for accuracy)
         self.logger = EventLogger(employee_id="001")
+        self.logger.tracer = self.tracer
+
+        if self.save_evidence:
+            self.evidence = EvidenceRecorder(EVIDENCE_DIR, max_bytes=EVIDENCE_MAX_BYTES)
+            self.logger.evidence_hook = self._reserve_evidence
+
+        # Detector registry - each one declares its own rate and vote window.
+        # Windows are in seconds so a profile's rates don't change detection latency
+        self.controller = ActivityController(self.logger, tracer=self.tracer)
+        self.controller.register(
+            "sleep", self._detect_sleep, rate_hz=self.settings["sleep_rate_hz"],
+            votes=VoteBuffer(64, ratio=0.6, window=VOTE_WINDOWS["sleep"], min_samples=MIN_VOTES, warmup=0.9),
+            alert="SLEEPING"
+        )
+        self.controller.register(
+            "phone", self._detect_phone, rate_hz=self.settings["phone_rate_hz"],
+            votes=VoteBuffer(64, ratio=0.6, window=VOTE_WINDOWS["phone"], min_samples=MIN_VOTES, warmup=0.4),
+            alert="PHONE USAGE"
+        )
+        self.controller.register(
+            "away", self._detect_away, rate_hz=self.settings["away_rate_hz"],
+            votes=VoteBuffer(64, ratio=0.6, window=VOTE_WINDOWS["away"], min_samples=MIN_VOTES, warmup=2.0),
+            alert="AWAY FROM DESK"
+        )
+
+        # Push the profile's thresholds into the detectors
+        self._apply_settings(self.profile, self.settings, report=False)
 
         print("=" * 60)
         print("🔵 AI Engine Started (Accuracy Mode)")
         print("📹 Webcam: Active")
-        print("🎯 Mode: High Accuracy (Slower but more reliable)")
+        print(f"🎯 Profile: {self.profile}")
         print("=" * 60)
 
-    def confirm_detection(self, buffer, current_state):
-        """Confirm detection only after multiple consecutive frames"""
-        buffer.append(current_state)
+    def apply_settings(self, profile, overrides=None):
+        """
+        Queue a new profile/overrides for the running detector (any thread).
+        Validated now, applied atomically between frames. Returns the new settings.
+        Overrides stack on the current (or still pending) settings while the
+        profile stays the same; a profile switch starts from its own values.
+        """
+        with self.settings_lock:
+            current_profile, current = self.pending_settings or (self.profile, self.settings)
+            if profile == current_profile:
+                overrides = {**current, **(overrides or {})}
+            settings = resolve_settings(profile, overrides)
+            self.pending_settings = (profile, settings)
+        return settings
+
+    def _apply_settings(self, profile, settings, report=True):
+        """Push settings into every component - detection thread only"""
+        changes = {
+            k: {"old": self.settings.get(k), "new": v}
+            for k, v in settings.items() if self.settings.get(k) != v
+        }
+
+        self.yolo_interval = settings["yolo_interval"]
+        self.yolo_conf = settings["yolo_conf"]
+        # Tracks must outlive the gap between keyframes, plus one missed detection
+        self.tracker.max_age = max(30, 2 * self.yolo_interval)
+
+        if "capture_width" in changes or "capture_height" in changes or "capture_fps" in changes:
+            # Same capture device - no reopen, the frame pool adapts to the new size
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, settings["capture_width"])
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, settings["capture_height"])
+            self.cap.set(cv2.CAP_PROP_FPS, settings["capture_fps"])
+
+        if "capture_width" in changes or "capture_height" in changes:
+            # Boxes and landmark points are in old-resolution pixels
+            self.tracker.reset()
+            self.landmarks.clear()
+
+        self.controller.set_rate("sleep", settings["sleep_rate_hz"])
+        self.controller.set_rate("phone", settings["phone_rate_hz"])
+        self.controller.set_rate("away", settings["away_rate_hz"])
+        self.landmarks.full_interval = 1.0 / settings["landmark_full_rate_hz"]
+
+        self.away_detector.away_threshold = settings["away_threshold"]
+        self.sleep_detector.threshold = settings["sleep_ear_threshold"]
+        self.sleep_detector.min_sleep_time = settings["min_sleep_time"]
+        self.logger.emit_interval = settings["emit_interval"]
+
+        previous_profile = self.profile
+        self.profile = profile
+        self.settings = settings
+
+        if report and (changes or profile != previous_profile):
+            metrics.record_change("profile", {
+                "from": previous_profile,
+                "to": profile,
+                "changes": changes
+            })
+            print(f"⚙️  Profile {previous_profile} → {profile}: {len(changes)} settings changed")
+
+    def _report_fps(self):
+        self.fps_window_frames += 1
+        now = time.time()
+        elapsed = now - self.fps_window_start
+        if elapsed >= 1.0:
+            metrics.gauge("detector.fps", round(self.fps_window_frames / elapsed, 1))
+            metrics.incr("detector.frames", self.fps_window_frames)
+            if self.pool is not None:
+                # Should stay flat after the first frames (grows only on resolution changes)
+                metrics.gauge("detector.pool_allocations", self.pool.allocations)
+            self.fps_window_start = now
+            self.fps_window_frames = 0
+
+    def _text_size(self, text, font, font_scale, font_thickness):
+        """cv2.getTextSize with a cache - labels repeat every frame"""
+        key = (text, font, font_scale, font_thickness)
+        size = self.text_sizes.get(key)
+        if size is None:
+            if len(self.text_sizes) > 256:
+                self.text_sizes.clear()
+            size = cv2.getTextSize(text, font, font_scale, font_thickness)
+            self.text_sizes[key] = size
+        return size
+
+    def _reserve_evidence(self, event):
+        """EventLogger hook: claim a snapshot for a start event without blocking"""
+        frame = self.current_frame
+        if frame is None:
+            return None
+
+        path = self.evidence.reserve(event["event_id"], event["timestamp"])
+        if path is None:
+            return None  # Encoder pool saturated - drop rather than wait
 
-        # Keep buffer size manageable
-        if len(buffer) > self.confirmation_frames:
-            buffer.pop(0)
+        if self.annotate_evidence:
+            # Handed off after overlays are drawn, at the end of process_frame
+            self.pending_evidence.append(path)
+        else:
+            # Overlays are drawn in place later - hand off a small copy now
+            self.evidence.submit(path, self.evidence.downscale(frame))
+        return path
+
+    def _submit_evidence(self, frame):
+        """Hand the finished frame to the encoder pool by reference"""
+        if self.pool is not None:
+            # The encoder owns this array now - the next capture gets a new one
+            self.pool.detach("capture")
+
+        for path in self.pending_evidence:
+            self.evidence.submit(path, frame)
+        self.pending_evidence = []
+
+    def _detect_sleep(self, frame, tracks):
+        """
+        Raw sleep signal from eyes (FaceMesh) or head position (Pose).
+        Full MediaPipe passes run at the landmark state's full rate; in
+        between, the last landmarks are tracked on a small ROI.
+        """
+        now = time.time()
+        person = self.landmarks.get(self._primary_person_id(tracks), now)
+
+        if not self.landmarks.needs_full(person, now):
+            with self.tracer.span("landmarks.track"):
+                eye_points = person.face.track(frame)
+                pose_points = person.pose.track(frame)
+
+            if eye_points is not None or pose_points is not None:
+                is_sleeping_eye = eye_points is not None and self.sleep_detector.detect_tracked(eye_points)
+                is_sleeping_pose = pose_points is not None and self.sleep_pose_detector.detect_tracked(pose_points)
+                person.last_result = is_sleeping_eye or is_sleeping_pose
+
+            # Nothing trackable until the next full pass - repeat its result
+            return person.last_result
+
+        # One RGB conversion shared by FaceMesh and Pose
+        with self.tracer.span("cvtColor.rgb"):
+            if self.pool is not None:
+                rgb = self.pool.get("rgb", frame.shape)
+                cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb)
+            else:
+                rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+        with self.tracer.span("facemesh"):
+            is_sleeping_eye = self.sleep_detector.detect(frame, rgb)
+        with self.tracer.span("pose"):
+            is_sleeping_pose = self.sleep_pose_detector.detect(frame, rgb)
+
+        # Refresh the trackers from the new landmarks
+        person.last_full = now
+        for tracker, points in (
+            (person.face, self.sleep_detector.last_eye_points),
+            (person.pose, self.sleep_pose_detector.last_points),
+        ):
+            if points:
+                tracker.reset(frame, points)
+            else:
+                tracker.clear()
+
+        person.last_result = is_sleeping_eye or is_sleeping_pose
+        return person.last_result
+
+    def _primary_person_id(self, tracks):
+        """Track ID of the largest person in view (None if nobody is tracked)"""
+        people = [t for t in tracks if t.label == "person"]
+        if not people:
+            return None
+        largest = max(people, key=lambda t: t.state[2] * t.state[3])
+        return largest.track_id
 
-        # Need majority of frames to confirm
-        if len(buffer) >= self.confirmation_frames:
-            true_count = sum(buffer)
-            return true_count >= (self.confirmation_frames * 0.6)  # 60% threshold
+    def _detect_phone(self, frame, tracks):
+        """Raw phone usage signal, attributed per person track"""
+        return self.phone_detector.detect_tracks(tracks)
 
-        return False
+    def _detect_away(self, frame, tracks):
+        """Raw away signal from tracked person presence"""
+        person_present = any(t.label == "person" for t in tracks)
+        return self.away_detector.update(person_present)
 
     def process_frame(self):
         """Process a single frame with accuracy focus"""
         if not self.running or not self.cap:
             return None
 
-        ret, frame = self.cap.read()
+        self.tracer.begin_frame()
+        with self.tracer.span("frame"):
+            return self._process_frame()
+
+    def _process_frame(self):
+        # Reconfiguration requested through the admin route
+        if self.pending_settings is not None:
+            with self.settings_lock:
+                profile, settings = self.pending_settings
+                self.pending_settings = None
+            self._apply_settings(profile, settings)
+
+        with self.tracer.span("cap.read"):
+            if self.pool is not None:
+                ret, frame = self.pool.read(self.cap)
+            else:
+                ret, frame = self.cap.read()
         if not ret:
             return None
 
         self.frame_count += 1
-        self.current_alerts = []
+        self._report_fps()
+
+        # YOLO only runs on keyframes - the tracker predicts boxes in between
+        run_yolo = (self.frame_count % self.yolo_interval == 0)
+
+        if run_yolo:
+            with self.tracer.span("yolo"):
+                results = model(frame, verbose=False, conf=self.yolo_conf)
+
+            with self.tracer.span("yolo.boxes"):
+                detections = []
+                for r in results:
+                    boxes = r.boxes
+                    if boxes is not None:
+                        for box in boxes:
+                            label = model.names[int(box.cls[0])]
+                            detections.append((label, tuple(box.xyxy[0].tolist()), float(box.conf[0])))
+
+            with self.tracer.span("tracker.update"):
+                self.tracker.update(detections)
+        else:
+            with self.tracer.span("tracker.predict"):
+                self.tracker.predict()
+
+        tracks = self.tracker.confirmed_tracks()
+
+        # Each registered detector runs at its own rate
+        self.current_frame = frame
+        self.controller.step(frame, tracks)
+        self.current_frame = None
+        self.current_alerts = self.controller.active_alerts()
 
-        # Only process detection every N frames for accuracy
-        should_detect = (self.frame_count % self.detection_interval == 0)
-
-        if should_detect:
-            # Sleep Detection - with confirmation
-            is_sleeping_eye = self.sleep_detector.detect(frame)
-            is_sleeping_pose = self.sleep_pose_detector.detect(frame)
-            is_sleeping_raw = is_sleeping_eye or is_sleeping_pose
-
-            is_sleeping = self.confirm_detection(self.sleep_buffer, is_sleeping_raw)
-
-            if is_sleeping:
-                self.current_alerts.append("SLEEPING")
-                self.logger.handle_event("sleep", True)
-            elif len(self.sleep_buffer) >= self.confirmation_frames and not is_sleeping:
-                self.logger.handle_event("sleep", False)
-
-            # YOLO Object Detection - run on every detection frame
-            results = model(frame, verbose=False, conf=0.5)  # Increased confidence threshold
-            all_boxes = []
-
-            for r in results:
-                boxes = r.boxes
-                if boxes is not None:
-                    for box in boxes:
-                        all_boxes.append(box)
-
-            # Phone Usage Detection - with confirmation
-            is_phone_using_raw = self.phone_detector.detect(all_boxes, model.names)
-            is_phone_using = self.confirm_detection(self.phone_buffer, is_phone_using_raw)
-
-            if is_phone_using:
-                self.current_alerts.append("PHONE USAGE")
-                self.logger.handle_event("phone", True)
-            elif len(self.phone_buffer) >= self.confirmation_frames and not is_phone_using:
-                self.logger.handle_event("phone", False)
-
-            # Away-from-desk Detection - with confirmation
-            person_present = any(
-                model.names[int(box.cls[0])] == "person"
-                for box in all_boxes
+        with self.tracer.span("draw"):
+            self._draw_overlays(frame, tracks)
+
+        if self.pending_evidence:
+            self._submit_evidence(frame)
+
+        return frame
+
+    def _draw_overlays(self, frame, tracks):
+        """Boxes, alert banners and status bar, drawn in place"""
+        # Draw tracked boxes on every frame (predicted between YOLO keyframes)
+        for track in tracks:
+            x1, y1, x2, y2 = map(int, track.box)
+            label = track.label
+
+            # Color coding
+            color = (0, 255, 0)  # Green default
+            thickness = 2
+
+            # Special highlighting
+            if label == "cell phone":
+                if track.track_id in self.phone_detector.phone_owners:
+                    color = (0, 255, 255)  # Yellow for phone held by a person
+                    thickness = 4
+                else:
+                    color = (255, 0, 255)  # Magenta for detected phone
+                    thickness = 3
+            elif label == "person":
+                color = (0, 255, 0)  # Green for person
+                thickness = 3
+
+            # Draw rectangle - ALWAYS draw boxes
+            cv2.rectangle(frame, (x1, y1), (x2, y2), color, thickness)
+
+            # Draw label with background
+            label_text = f"{label} #{track.track_id} {track.conf:.2f}"
+            font = cv2.FONT_HERSHEY_SIMPLEX
+            font_scale = 0.7
+            font_thickness = 2
+
+            (text_width, text_height), baseline = self._text_size(
+                label_text, font, font_scale, font_thickness
             )
 
-            is_away_raw = self.away_detector.update(person_present)
-            is_away = self.confirm_detection(self.away_buffer, is_away_raw)
-
-            if is_away:
-                self.current_alerts.append("AWAY FROM DESK")
-                self.logger.handle_event("away", True)
-            elif len(self.away_buffer) >= self.confirmation_frames and not is_away:
-                self.logger.handle_event("away", False)
-
-            # Draw ALL bounding boxes with labels
-            for r in results:
-                boxes = r.boxes
-                if boxes is not None and len(boxes) > 0:
-                    for box in boxes:
-                        # Get box data
-                        cls = int(box.cls[0])
-                        conf = float(box.conf[0])
-                        x1, y1, x2, y2 = map(int, box.xyxy[0].tolist())
-                        label = model.names[cls]
-
-                        # Color coding
-                        color = (0, 255, 0)  # Green default
-                        thickness = 2
-
-                        # Special highlighting
-                        if label == "cell phone":
-                            if is_phone_using:
-                                color = (0, 255, 255)  # Yellow for active phone
-                                thickness = 4
-                            else:
-                                color = (255, 0, 255)  # Magenta for detected phone
-                                thickness = 3
-                        elif label == "person":
-                            color = (0, 255, 0)  # Green for person
-                            thickness = 3
-
-                        # Draw rectangle - ALWAYS draw boxes
-                        cv2.rectangle(frame, (x1, y1), (x2, y2), color, thickness)
-
-                        # Draw label with background
-                        label_text = f"{label} {conf:.2f}"
-                        font = cv2.FONT_HERSHEY_SIMPLEX
-                        font_scale = 0.7
-                        font_thickness = 2
-
-                        (text_width, text_height), baseline = cv2.getTextSize(
-                            label_text, font, font_scale, font_thickness
-                        )
-
-                        # Draw filled rectangle behind text
-                        cv2.rectangle(
-                            frame,
-                            (x1, y1 - text_height - baseline - 8),
-                            (x1 + text_width + 10, y1),
-                            color,
-                            -1
-                        )
-
-                        # Draw label text in black
-                        cv2.putText(
-                            frame,
-                            label_text,
-                            (x1 + 5, y1 - baseline - 5),
-                            font,
-                            font_scale,
-                            (0, 0, 0),
-                            font_thickness
-                        )
+            # Draw filled rectangle behind text
+            cv2.rectangle(
+                frame,
+                (x1, y1 - text_height - baseline - 8),
+                (x1 + text_width + 10, y1),
+                color,
+                -1
+            )
+
+            # Draw label text in black
+            cv2.putText(
+                frame,
+                label_text,
+                (x1 + 5, y1 - baseline - 5),
+                font,
+                font_scale,
+                (0, 0, 0),
+                font_thickness
+            )
 
         # Always draw current alerts (even on non-detection frames)
         alert_y = 40
@@ -224,7 +445,7 @@ class DetectionRunner:
             font_scale = 1.0
             font_thickness = 3
 
-            (text_w, text_h), baseline = cv2.getTextSize(
+            (text_w, text_h), baseline = self._text_size(
                 alert_text, font, font_scale, font_thickness
             )
 
@@ -270,15 +491,14 @@ class DetectionRunner:
         )
 
         # Get detection info
-        if should_detect and 'all_boxes' in locals():
-            detected_count = len(all_boxes)
-            person_status = "✓" if person_present else "✗"
+        detected_count = len(tracks)
+        if self.tracker.tracks:
+            person_status = "✓" if any(t.label == "person" for t in tracks) else "✗"
         else:
-            detected_count = 0
             person_status = "..."
 
         status_text = f"Frame: {self.frame_count} | Objects: {detected_count} | Person: {person_status}"
-        status_text += f" | Mode: High Accuracy"
+        status_text += f" | Profile: {self.profile}"
 
         cv2.putText(
             frame,
@@ -290,8 +510,6 @@ class DetectionRunner:
             2
         )
 
-        return frame
-
     def run_loop(self):
         """Main detection loop - runs in main thread"""
         print("🎥 Opening camera window...")
@@ -303,10 +521,11 @@ class DetectionRunner:
                 break
 
             # Display the frame
-            cv2.imshow("Employee Monitoring - High Accuracy Mode", frame)
+            with self.tracer.span("preview"):
+                cv2.imshow("Employee Monitoring - High Accuracy Mode", frame)
 
-            # Check for 'q' key press
-            key = cv2.waitKey(1) & 0xFF
+                # Check for 'q' key press
+                key = cv2.waitKey(1) & 0xFF
             if key == ord('q'):
                 print("\n👋 User pressed 'q' - closing camera window")
                 break
@@ -316,10 +535,12 @@ class DetectionRunner:
     def run_headless(self):
         """Run without display window"""
         while self.running:
+            started = time.time()
             frame = self.process_frame()
             if frame is None:
                 break
-            time.sleep(0.033)  # ~30 FPS
+            # Pace to the profile's frame rate
+            time.sleep(max(0.0, 1.0 / self.settings["capture_fps"] - (time.time() - started)))
 
     def stop(self):
         """Stop detection and cleanup"""
@@ -329,6 +550,10 @@ class DetectionRunner:
             self.cap.release()
             print("📹 Camera released")
         cv2.destroyAllWindows()
+        if self.evidence is not None and not self.evidence.wait_idle():
+            print(f"⚠️  {self.evidence.in_flight} evidence snapshots still being written")
+        if self.pool is not None:
+            self.pool.clear()
         print("✅ AI Engine stopped\n")
 
 
@@ -0,0 +1,147 @@
+import os
+import queue
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+import cv2
+
+
+class EvidenceRecorder:
+    """
+    Saves a JPEG snapshot when an activity starts, off the detection loop.
+
+    reserve() is called on the detection thread and only claims a slot in the
+    bounded encoder queue - if every slot is taken the snapshot is dropped
+    and None is returned, so detection never waits. submit() hands the frame
+    over by reference; worker threads downscale, JPEG-encode and write it.
+    The on-disk store is capped at max_bytes, oldest files first.
+    """
+
+    def __init__(self, directory, workers=2, max_pending=4, max_width=640,
+                 jpeg_quality=80, max_bytes=500 * 1024 * 1024):
+        self.directory = directory
+        self.max_width = max_width
+        self.jpeg_quality = jpeg_quality
+        self.max_bytes = max_bytes
+
+        os.makedirs(directory, exist_ok=True)
+
+        self.slots = threading.BoundedSemaphore(max_pending)
+        self.jobs = queue.Queue()
+        self.in_flight = 0  # Submitted snapshots not yet written (or failed)
+        self.idle = threading.Condition()
+        self.dropped = 0
+        self.saved = 0
+
+        # Existing files, oldest first, so the size cap survives restarts
+        self.files_lock = threading.Lock()
+        self.files = deque()
+        self.total_bytes = 0
+        self._scan()
+
+        self.workers = []
+        for _ in range(workers):
+            t = threading.Thread(target=self._work, daemon=True)
+            t.start()
+            self.workers.append(t)
+
+    def _scan(self):
+        found = []
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if name.endswith(".jpg"):
+                    path = os.path.join(root, name)
+                    stat = os.stat(path)
+                    found.append((stat.st_mtime, path, stat.st_size))
+
+        for _, path, size in sorted(found):
+            self.files.append((path, size))
+            self.total_bytes += size
+
+    def reserve(self, event_id, when=None):
+        """
+        Claim an encoder slot for an event.
+        Returns the snapshot path relative to the evidence directory, or None if saturated.
+        """
+        if not self.slots.acquire(blocking=False):
+            self.dropped += 1
+            return None
+
+        when = when or datetime.now()
+        return f"{when:%Y-%m-%d}/{event_id}.jpg"
+
+    def submit(self, relative_path, frame):
+        """Queue a reserved snapshot. frame must not be modified afterwards"""
+        with self.idle:
+            self.in_flight += 1
+        self.jobs.put((relative_path, frame))
+
+    def _fit_width(self, frame):
+        """frame itself if narrow enough, else a resized array no wider than max_width"""
+        h, w = frame.shape[:2]
+        if w <= self.max_width:
+            return frame
+        scale = self.max_width / float(w)
+        return cv2.resize(frame, (self.max_width, int(h * scale)), interpolation=cv2.INTER_AREA)
+
+    def downscale(self, frame):
+        """Resized copy no wider than max_width (always a new array)"""
+        image = self._fit_width(frame)
+        return image.copy() if image is frame else image
+
+    def _work(self):
+        while True:
+            relative_path, frame = self.jobs.get()
+            try:
+                self._save(relative_path, frame)
+            except Exception as e:
+                print(f"[EVIDENCE] Failed to save {relative_path}: {e}")
+            finally:
+                self.slots.release()
+                with self.idle:
+                    self.in_flight -= 1
+                    self.idle.notify_all()
+
+    def _save(self, relative_path, frame):
+        image = self._fit_width(frame)
+        ok, encoded = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality])
+        if not ok:
+            raise RuntimeError("JPEG encoding failed")
+
+        path = os.path.join(self.directory, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(encoded.tobytes())
+        os.replace(tmp, path)
+
+        with self.files_lock:
+            self.files.append((path, len(encoded)))
+            self.total_bytes += len(encoded)
+            self.saved += 1
+            self._enforce_cap()
+
+    def _enforce_cap(self):
+        while self.total_bytes > self.max_bytes and len(self.files) > 1:
+            old_path, size = self.files.popleft()
+            self.total_bytes -= size
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+
+    def wait_idle(self, timeout=5.0):
+        """
+        Block until every submitted snapshot is written, including ones a
+        worker is still encoding (used on shutdown). Returns False on timeout.
+        """
+        deadline = time.time() + timeout
+        with self.idle:
+            while self.in_flight:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                self.idle.wait(remaining)
+        return True
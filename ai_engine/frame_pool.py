@@ -0,0 +1,50 @@
+import numpy as np
+
+
+class FramePool:
+    """
+    Named, reusable image buffers for the detection loop.
+    Each name keeps one array that is only reallocated when the
+    requested shape or dtype changes (e.g. camera resolution switch).
+    """
+
+    def __init__(self):
+        self.buffers = {}
+        self.allocations = 0  # Number of real allocations, for diagnostics
+
+    def get(self, name, shape, dtype=np.uint8):
+        """Return the buffer for name, allocating only on first use or shape change"""
+        buf = self.buffers.get(name)
+        if buf is None or buf.shape != tuple(shape) or buf.dtype != dtype:
+            buf = np.empty(shape, dtype=dtype)
+            self.buffers[name] = buf
+            self.allocations += 1
+        return buf
+
+    def read(self, cap, name="capture"):
+        """cap.read() into the pooled capture buffer"""
+        buf = self.buffers.get(name)
+        if buf is None:
+            # First frame tells us the camera's real size
+            ret, frame = cap.read()
+            if ret:
+                self.buffers[name] = frame
+                self.allocations += 1
+            return ret, frame
+
+        ret, frame = cap.read(image=buf)
+        if ret and frame is not buf:
+            # Driver changed resolution - keep the new array for next time
+            self.buffers[name] = frame
+            self.allocations += 1
+        return ret, frame
+
+    def detach(self, name="capture"):
+        """
+        Hand a buffer's ownership to the caller (e.g. a background encoder).
+        The next get()/read() for this name allocates a fresh array.
+        """
+        return self.buffers.pop(name, None)
+
+    def clear(self):
+        self.buffers = {}
@@ -0,0 +1,81 @@
+import time
+from contextlib import nullcontext
+
+from ai_engine.logic.voting import VoteBuffer
+
+
+class RegisteredDetector:
+    """A detector plugged into the ActivityController with its own cadence"""
+
+    def __init__(self, name, fn, rate_hz=None, votes=None, alert=None, event_type=None):
+        self.name = name
+        self.fn = fn
+        self.interval = 1.0 / rate_hz if rate_hz else 0.0  # 0 → every frame
+        self.votes = votes if votes is not None else VoteBuffer(5, ratio=0.6)
+        self.alert = alert
+        self.event_type = event_type or name
+
+        self.last_run = None
+        self.active = False
+
+    def due(self, now):
+        return self.last_run is None or now - self.last_run >= self.interval
+
+
+class ActivityController:
+    """
+    Registry of activity detectors.
+    Each detector is called as fn(frame, tracks) -> bool at its own rate,
+    its raw result goes through its VoteBuffer, and confirmed state changes
+    are passed to the EventLogger.
+    """
+
+    def __init__(self, logger=None, tracer=None):
+        self.logger = logger
+        self.tracer = tracer  # Optional FrameTracer - one span per detector run
+        self.detectors = {}  # name → RegisteredDetector, run in registration order
+
+    def register(self, name, fn, rate_hz=None, votes=None, alert=None, event_type=None):
+        """Add a detector. rate_hz=None runs it on every frame"""
+        detector = RegisteredDetector(name, fn, rate_hz, votes, alert, event_type)
+        self.detectors[name] = detector
+        return detector
+
+    def set_rate(self, name, rate_hz):
+        """Change a detector's run rate on the fly (None → every frame)"""
+        self.detectors[name].interval = 1.0 / rate_hz if rate_hz else 0.0
+
+    def unregister(self, name):
+        self.detectors.pop(name, None)
+
+    def step(self, frame, tracks, now=None):
+        """Run every detector that is due. Returns names of detectors that ran"""
+        if now is None:
+            now = time.time()
+
+        ran = []
+        for detector in self.detectors.values():
+            if not detector.due(now):
+                continue
+
+            detector.last_run = now
+            with self.tracer.span(f"detect.{detector.name}") if self.tracer else nullcontext():
+                raw = detector.fn(frame, tracks)
+            confirmed = detector.votes.push(raw, now)
+
+            if confirmed:
+                detector.active = True
+                if self.logger:
+                    self.logger.handle_event(detector.event_type, True)
+            elif detector.votes.ready:
+                detector.active = False
+                if self.logger:
+                    self.logger.handle_event(detector.event_type, False)
+
+            ran.append(detector.name)
+
+        return ran
+
+    def active_alerts(self):
+        """Alert labels for all detectors currently in confirmed state"""
+        return [d.alert for d in self.detectors.values() if d.active and d.alert]
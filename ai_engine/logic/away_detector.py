@@ -1,14 +1,15 @@
 import time
 
+from ai_engine.logic.voting import VoteBuffer
+
 
 class AwayDetector:
     def __init__(self):
         self.last_seen_time = time.time()
         self.away_threshold = 5  # Increased from 3 to 5 seconds
 
-        # Confirmation buffer
-        self.person_buffer = []
-        self.buffer_size = 10  # Need 10 frames of consistent data
+        # Confirmation buffer - covers the last 3 seconds regardless of call rate
+        self.person_buffer = VoteBuffer(10, ratio=0.6, window=3.0, min_samples=2)
         self.currently_away = False
 
     def update(self, person_detected):
@@ -18,16 +19,11 @@ class AwayDetector:
         """
         current_time = time.time()
 
-        # Add to confirmation buffer
-        self.person_buffer.append(person_detected)
-        if len(self.person_buffer) > self.buffer_size:
-            self.person_buffer.pop(0)
+        # Add to confirmation buffer (majority voting)
+        confirmed_present = self.person_buffer.push(person_detected, current_time)
 
         # Need consistent detection
-        if len(self.person_buffer) >= self.buffer_size:
-            # Majority voting
-            confirmed_present = sum(self.person_buffer) >= (self.buffer_size * 0.6)
-
+        if self.person_buffer.ready:
             if confirmed_present:
                 self.last_seen_time = current_time
 
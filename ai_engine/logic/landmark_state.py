@@ -0,0 +1,151 @@
+import time
+
+import cv2
+import numpy as np
+
+
+class LandmarkTracker:
+    """
+    Follows a handful of landmark points between full MediaPipe passes
+    with pyramidal Lucas-Kanade optical flow on a small grayscale ROI
+    around them, with a forward-backward check to detect drift.
+    """
+
+    def __init__(self, padding=0.4, min_roi=48, max_fb_error=2.0):
+        self.padding = padding  # ROI margin as a fraction of the points' extent
+        self.min_roi = min_roi  # Minimum ROI side in pixels
+        self.max_fb_error = max_fb_error  # Max forward-backward error in pixels
+
+        self.points = None  # (N, 2) float32 in frame coordinates
+        self.prev_gray = None
+        self.roi = None  # (x1, y1, x2, y2) of prev_gray
+
+        self.lk_params = dict(
+            winSize=(15, 15),
+            maxLevel=2,
+            criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 10, 0.03)
+        )
+
+    def _roi_for(self, points, frame_shape):
+        """Padded ROI clipped to the frame, or None if nothing of it is inside"""
+        h, w = frame_shape[:2]
+        x1, y1 = points.min(axis=0)
+        x2, y2 = points.max(axis=0)
+
+        pad_x = max((x2 - x1) * self.padding, (self.min_roi - (x2 - x1)) / 2.0, 0)
+        pad_y = max((y2 - y1) * self.padding, (self.min_roi - (y2 - y1)) / 2.0, 0)
+
+        roi = (
+            max(0, int(x1 - pad_x)), max(0, int(y1 - pad_y)),
+            min(w, int(x2 + pad_x) + 1), min(h, int(y2 + pad_y) + 1)
+        )
+        # Points off-frame (e.g. pose landmarks below the camera view) leave nothing to track
+        if roi[2] - roi[0] < 2 or roi[3] - roi[1] < 2:
+            return None
+        return roi
+
+    def _crop_gray(self, frame, roi):
+        x1, y1, x2, y2 = roi
+        return cv2.cvtColor(frame[y1:y2, x1:x2], cv2.COLOR_BGR2GRAY)
+
+    def reset(self, frame, points):
+        """Start tracking from points found by a full detection"""
+        self.points = np.asarray(points, dtype=np.float32).reshape(-1, 2)
+        self.roi = self._roi_for(self.points, frame.shape)
+        if self.roi is None:
+            self.clear()
+            return
+        self.prev_gray = self._crop_gray(frame, self.roi)
+
+    def clear(self):
+        self.points = None
+        self.prev_gray = None
+        self.roi = None
+
+    @property
+    def active(self):
+        return self.points is not None
+
+    def track(self, frame):
+        """Move the points to this frame. Returns the new points, or None if lost"""
+        if self.points is None:
+            return None
+
+        x1, y1, x2, y2 = self.roi
+        gray = self._crop_gray(frame, self.roi)
+        if gray.shape != self.prev_gray.shape:
+            self.clear()
+            return None
+
+        offset = np.array([x1, y1], dtype=np.float32)
+        p0 = (self.points - offset).reshape(-1, 1, 2)
+
+        p1, status, _ = cv2.calcOpticalFlowPyrLK(self.prev_gray, gray, p0, None, **self.lk_params)
+        if p1 is None:
+            self.clear()
+            return None
+
+        # Track back and require the round trip to land where we started
+        p0_back, status_back, _ = cv2.calcOpticalFlowPyrLK(gray, self.prev_gray, p1, None, **self.lk_params)
+        fb_error = np.linalg.norm((p0 - p0_back).reshape(-1, 2), axis=1)
+        good = (status.ravel() == 1) & (status_back.ravel() == 1) & (fb_error < self.max_fb_error)
+
+        if not good.all():
+            self.clear()
+            return None
+
+        self.points = p1.reshape(-1, 2) + offset
+
+        # Next frame is compared against this one, around the new positions
+        self.roi = self._roi_for(self.points, frame.shape)
+        if self.roi is None:
+            self.clear()
+            return None
+        self.prev_gray = self._crop_gray(frame, self.roi)
+
+        return self.points
+
+
+class PersonLandmarks:
+    """Last known face/pose landmarks for one person, plus their trackers"""
+
+    def __init__(self):
+        self.face = LandmarkTracker()
+        self.pose = LandmarkTracker()
+        self.last_full = 0.0  # time of last full FaceMesh/Pose pass
+        self.last_seen = 0.0
+        self.last_result = False  # Raw result reused when nothing can be tracked
+
+
+class LandmarkState:
+    """
+    Per-person landmark memory keyed by person track ID.
+    Full detections refresh it; in between, trackers carry the points.
+    """
+
+    def __init__(self, full_rate_hz=3, max_idle=5.0):
+        self.full_interval = 1.0 / full_rate_hz  # Seconds between full MediaPipe passes
+        self.max_idle = max_idle  # Forget people not seen for this long
+        self.people = {}
+
+    def get(self, person_id, now=None):
+        now = time.time() if now is None else now
+        person = self.people.get(person_id)
+        if person is None:
+            person = self.people[person_id] = PersonLandmarks()
+        person.last_seen = now
+
+        # Drop state for people who left
+        for pid in [p for p, s in self.people.items() if now - s.last_seen > self.max_idle]:
+            del self.people[pid]
+
+        return person
+
+    def clear(self):
+        """Forget everyone (e.g. after a capture resolution change)"""
+        self.people = {}
+
+    def needs_full(self, person, now=None):
+        """Full detection is due (trackers only fill the gaps between passes)"""
+        now = time.time() if now is None else now
+        return now - person.last_full >= self.full_interval
@@ -1,5 +1,9 @@
 class PhoneDetector:
 
+    def __init__(self):
+        # phone track id -> person track id, refreshed by detect_tracks()
+        self.phone_owners = {}
+
     def detect(self, boxes, model_names):
         """
         Input:
@@ -38,3 +42,45 @@ class PhoneDetector:
                     return True  # phone inside person zone
 
         return False
+
+    def detect_tracks(self, tracks):
+        """
+        Input:
+            tracks: confirmed ObjectTracker tracks
+        Output:
+            True → phone usage detected
+            False → no usage
+
+        Also records which person track holds each phone in self.phone_owners
+        """
+        person_tracks = [t for t in tracks if t.label == "person"]
+        phone_tracks = [t for t in tracks if t.label == "cell phone"]
+
+        self.phone_owners = {}
+
+        if not person_tracks or not phone_tracks:
+            return False
+
+        for phone in phone_tracks:
+            fx1, fy1, fx2, fy2 = phone.box
+            phone_center = ((fx1 + fx2) / 2, (fy1 + fy2) / 2)
+            owner = None
+            best_dist = None
+
+            for person in person_tracks:
+                px1, py1, px2, py2 = person.box
+
+                # Same person zone rule as detect()
+                if fx1 > px1 - 50 and fy1 > py1 - 50 and fx2 < px2 + 50 and fy2 < py2 + 50:
+                    # Several people can overlap - attribute to the closest one
+                    person_center = ((px1 + px2) / 2, (py1 + py2) / 2)
+                    dist = (phone_center[0] - person_center[0]) ** 2 + \
+                        (phone_center[1] - person_center[1]) ** 2
+                    if best_dist is None or dist < best_dist:
+                        owner = person.track_id
+                        best_dist = dist
+
+            if owner is not None:
+                self.phone_owners[phone.track_id] = owner
+
+        return bool(self.phone_owners)
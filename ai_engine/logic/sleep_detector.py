@@ -3,11 +3,14 @@ import mediapipe as mp
 import math
 import time
 
+from ai_engine.logic.voting import VoteBuffer
+
 mp_face_mesh = mp.solutions.face_mesh
 
 # Eye landmark indices (MediaPipe Face Mesh)
 LEFT_EYE = [33, 160, 158, 133, 153, 144]
 RIGHT_EYE = [362, 385, 387, 263, 373, 380]
+EYE_POINTS = LEFT_EYE + RIGHT_EYE
 
 
 def euclidean_dist(p1, p2):
@@ -21,8 +24,14 @@ def eye_aspect_ratio(landmarks, eye_points):
     return (top + bottom) / (2.0 * width)
 
 
+def average_ear(landmarks):
+    left_ear = eye_aspect_ratio(landmarks, LEFT_EYE)
+    right_ear = eye_aspect_ratio(landmarks, RIGHT_EYE)
+    return (left_ear + right_ear) / 2
+
+
 class SleepDetector:
-    def __init__(self):
+    def __init__(self, eye_window=0.7):
         self.sleep_start = None
         self.sleeping = False
 
@@ -35,11 +44,14 @@ class SleepDetector:
         self.last_blink_time = 0
         self.blink_cooldown = 0.5  # Ignore detections 0.5s after blink
 
-        # Confirmation buffer
-        self.closed_eye_buffer = []
-        self.buffer_size = 10  # Need 10 consecutive frames
+        # Confirmation buffer - 80% of the last eye_window seconds, at any sampling rate
+        self.closed_eye_buffer = VoteBuffer(
+            64, ratio=0.8, window=eye_window, min_samples=2, warmup=eye_window - 0.1
+        )
 
         self.face = None
+        self.eye_landmarks = {}  # Reused landmark index → pixel point map
+        self.last_eye_points = None  # Eye points from the last full pass, EYE_POINTS order
 
     def setup(self):
         """Initialize face mesh with optimized settings"""
@@ -50,64 +62,77 @@ class SleepDetector:
             min_tracking_confidence=0.5
         )
 
-    def detect(self, frame):
-        """Detect sleeping with improved accuracy"""
+    def detect(self, frame, rgb=None):
+        """
+        Detect sleeping with improved accuracy
+        rgb: optional RGB copy of frame (shared with other detectors)
+        """
         h, w = frame.shape[:2]
 
-        results = self.face.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        if rgb is None:
+            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+        results = self.face.process(rgb)
 
         # If no face detected, reset state
         if not results.multi_face_landmarks:
+            self.last_eye_points = None
             self.sleeping = False
             self.sleep_start = None
             self.closed_eye_buffer.clear()
             return False
 
         for face in results.multi_face_landmarks:
-            # Convert landmarks to pixel locations
-            landmarks = [(int(l.x * w), int(l.y * h)) for l in face.landmark]
-
-            # Calculate EAR for both eyes
-            left_ear = eye_aspect_ratio(landmarks, LEFT_EYE)
-            right_ear = eye_aspect_ratio(landmarks, RIGHT_EYE)
-            ear = (left_ear + right_ear) / 2
-
-            current_time = time.time()
-
-            # Detect blink (very quick eye closure)
-            if ear < self.blink_threshold:
-                self.last_blink_time = current_time
-                self.closed_eye_buffer.clear()
-                return False
-
-            # Ignore detections shortly after blink
-            if current_time - self.last_blink_time < self.blink_cooldown:
-                return False
-
-            # Eyes closed check with buffer
-            eyes_closed = ear < self.threshold
-
-            # Add to buffer
-            self.closed_eye_buffer.append(eyes_closed)
-            if len(self.closed_eye_buffer) > self.buffer_size:
-                self.closed_eye_buffer.pop(0)
-
-            # Need consistent closed eyes
-            if len(self.closed_eye_buffer) >= self.buffer_size:
-                confirmed_closed = sum(self.closed_eye_buffer) >= (self.buffer_size * 0.8)
-
-                if confirmed_closed:
-                    if not self.sleeping:
-                        self.sleep_start = current_time
-                        self.sleeping = True
-                else:
-                    self.sleeping = False
-                    self.sleep_start = None
-
-            # Require sustained sleeping
-            if self.sleeping and self.sleep_start:
-                sleep_duration = current_time - self.sleep_start
-                if sleep_duration >= self.min_sleep_time:
-                    return True
-
-        return False
\ No newline at end of file
+            # Convert only the eye landmarks to pixel locations
+            landmarks = self.eye_landmarks
+            for i in EYE_POINTS:
+                lm = face.landmark[i]
+                landmarks[i] = (int(lm.x * w), int(lm.y * h))
+
+            # Kept so the landmark tracker can follow them between full passes
+            self.last_eye_points = [landmarks[i] for i in EYE_POINTS]
+
+            return self.update_ear(average_ear(landmarks), time.time())
+
+        return False
+
+    def update_ear(self, ear, current_time):
+        """Temporal sleep logic for one EAR sample (from FaceMesh or tracked landmarks)"""
+        # Detect blink (very quick eye closure)
+        if ear < self.blink_threshold:
+            self.last_blink_time = current_time
+            self.closed_eye_buffer.clear()
+            return False
+
+        # Ignore detections shortly after blink
+        if current_time - self.last_blink_time < self.blink_cooldown:
+            return False
+
+        # Eyes closed check with buffer
+        eyes_closed = ear < self.threshold
+
+        # Add to buffer
+        confirmed_closed = self.closed_eye_buffer.push(eyes_closed, current_time)
+
+        # Need consistent closed eyes
+        if self.closed_eye_buffer.ready:
+            if confirmed_closed:
+                if not self.sleeping:
+                    self.sleep_start = current_time
+                    self.sleeping = True
+            else:
+                self.sleeping = False
+                self.sleep_start = None
+
+        # Require sustained sleeping
+        if self.sleeping and self.sleep_start:
+            sleep_duration = current_time - self.sleep_start
+            if sleep_duration >= self.min_sleep_time:
+                return True
+
+        return False
+
+    def detect_tracked(self, eye_points):
+        """Sleep check from tracked eye points (ordered like EYE_POINTS)"""
+        landmarks = dict(zip(EYE_POINTS, eye_points))
+        return self.update_ear(average_ear(landmarks), time.time())
@@ -1,33 +1,55 @@
+import cv2
 import mediapipe as mp
 import math
 
 mp_pose = mp.solutions.pose
 
+# Landmarks kept for tracking between full passes
+NOSE, LEFT_SHOULDER, RIGHT_SHOULDER = 0, 11, 12
+
+
+def head_below_shoulders(nose, left_shoulder, right_shoulder):
+    """Pixel points → True if the head is lower than the shoulder line"""
+    shoulder_y = (left_shoulder[1] + right_shoulder[1]) / 2
+    return nose[1] > shoulder_y
+
+
 class SleepPoseDetector:
     def __init__(self):
         self.pose = mp_pose.Pose(min_detection_confidence=0.5,
                                  min_tracking_confidence=0.5)
+        self.last_points = None  # [nose, left shoulder, right shoulder] in pixels
 
-    def detect(self, frame):
+    def detect(self, frame, rgb=None):
         h, w = frame.shape[:2]
-        results = self.pose.process(frame)
+
+        # MediaPipe expects RGB input
+        if rgb is None:
+            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+        results = self.pose.process(rgb)
 
         if not results.pose_landmarks:
+            self.last_points = None
             return False
 
         lm = results.pose_landmarks.landmark
 
         # Extract key points
-        nose = lm[0]
-        left_shoulder = lm[11]
-        right_shoulder = lm[12]
+        nose = lm[NOSE]
+        left_shoulder = lm[LEFT_SHOULDER]
+        right_shoulder = lm[RIGHT_SHOULDER]
 
         # Convert to pixel coordinates
-        nose_y = nose.y * h
-        shoulder_y = ((left_shoulder.y + right_shoulder.y) / 2) * h
+        self.last_points = [
+            (nose.x * w, nose.y * h),
+            (left_shoulder.x * w, left_shoulder.y * h),
+            (right_shoulder.x * w, right_shoulder.y * h),
+        ]
 
         # If head is LOWER than shoulder → sleeping on table
-        if nose_y > shoulder_y:
-            return True
+        return head_below_shoulders(*self.last_points)
 
-        return False
+    def detect_tracked(self, points):
+        """Head-vs-shoulder check from tracked [nose, left, right shoulder] points"""
+        return head_below_shoulders(*points)
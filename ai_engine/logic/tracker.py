@@ -0,0 +1,160 @@
+import itertools
+
+
+def iou(box_a, box_b):
+    """Intersection-over-union of two (x1, y1, x2, y2) boxes"""
+    ix1 = max(box_a[0], box_b[0])
+    iy1 = max(box_a[1], box_b[1])
+    ix2 = min(box_a[2], box_b[2])
+    iy2 = min(box_a[3], box_b[3])
+
+    inter = max(0.0, ix2 - ix1) * max(0.0, iy2 - iy1)
+    if inter == 0:
+        return 0.0
+
+    area_a = (box_a[2] - box_a[0]) * (box_a[3] - box_a[1])
+    area_b = (box_b[2] - box_b[0]) * (box_b[3] - box_b[1])
+    return inter / float(area_a + area_b - inter)
+
+
+class Track:
+    """
+    One tracked object with a constant-velocity box model.
+    State is (cx, cy, w, h) plus per-frame velocity of each term,
+    corrected with fixed alpha/beta gains (a steady-state Kalman filter).
+    """
+
+    def __init__(self, track_id, label, box, conf):
+        self.track_id = track_id
+        self.label = label
+        self.conf = conf
+
+        x1, y1, x2, y2 = box
+        self.state = [(x1 + x2) / 2.0, (y1 + y2) / 2.0, x2 - x1, y2 - y1]
+        self.velocity = [0.0, 0.0, 0.0, 0.0]
+
+        self.hits = 1
+        self.frames_since_update = 0
+
+    @property
+    def box(self):
+        cx, cy, w, h = self.state
+        return (cx - w / 2.0, cy - h / 2.0, cx + w / 2.0, cy + h / 2.0)
+
+    def predict(self):
+        """Advance the box by one frame using the current velocity"""
+        for i in range(4):
+            self.state[i] += self.velocity[i]
+
+        # Never let the box collapse
+        self.state[2] = max(1.0, self.state[2])
+        self.state[3] = max(1.0, self.state[3])
+        self.frames_since_update += 1
+
+    def correct(self, box, conf, alpha, beta):
+        """Blend a new detection into the predicted state"""
+        x1, y1, x2, y2 = box
+        measured = [(x1 + x2) / 2.0, (y1 + y2) / 2.0, x2 - x1, y2 - y1]
+
+        # Velocity is per frame, so spread the residual over the frames we skipped
+        steps = max(1, self.frames_since_update)
+        for i in range(4):
+            residual = measured[i] - self.state[i]
+            self.state[i] += alpha * residual
+            self.velocity[i] += beta * residual / steps
+
+        self.conf = conf
+        self.hits += 1
+        self.frames_since_update = 0
+
+
+class ObjectTracker:
+    """
+    Lightweight IoU tracker for YOLO detections.
+    update() is called on frames where YOLO ran, predict() on every
+    other frame so boxes keep moving between keyframes.
+    """
+
+    def __init__(self, labels=("person", "cell phone")):
+        self.labels = set(labels)
+        self.tracks = []
+        self._ids = itertools.count(1)
+
+        self.iou_threshold = 0.3  # Minimum overlap to match a detection to a track
+        self.min_hits = 2  # Detections needed before a track is trusted
+        self.max_age = 30  # Frames a track survives without a detection
+        self.distance_gate = 1.0  # Fallback match radius, in track widths
+
+        # Filter gains - higher alpha trusts detections more
+        self.alpha = 0.6
+        self.beta = 0.2
+
+    def predict(self):
+        """Move all tracks forward one frame and drop stale ones"""
+        for track in self.tracks:
+            track.predict()
+
+        self.tracks = [t for t in self.tracks if t.frames_since_update <= self.max_age]
+
+    def update(self, detections):
+        """
+        Input:
+            detections: list of (label, (x1, y1, x2, y2), conf)
+        Output:
+            list of confirmed tracks
+        """
+        self.predict()
+
+        detections = [d for d in detections if d[0] in self.labels]
+
+        # Greedy matching on IoU, best pairs first, same label only
+        pairs = []
+        for t_idx, track in enumerate(self.tracks):
+            track_box = track.box
+            for d_idx, (label, box, _) in enumerate(detections):
+                if label != track.label:
+                    continue
+                overlap = iou(track_box, box)
+                if overlap >= self.iou_threshold:
+                    pairs.append((overlap, t_idx, d_idx))
+                elif self._center_distance(track_box, box) <= self.distance_gate * track.state[2]:
+                    # Small fast objects (phones) can move past IoU range between
+                    # keyframes - accept nearby centres with a lower score
+                    pairs.append((overlap * 0.5, t_idx, d_idx))
+
+        pairs.sort(reverse=True)
+        matched_tracks = set()
+        matched_detections = set()
+
+        for _, t_idx, d_idx in pairs:
+            if t_idx in matched_tracks or d_idx in matched_detections:
+                continue
+            _, box, conf = detections[d_idx]
+            self.tracks[t_idx].correct(box, conf, self.alpha, self.beta)
+            matched_tracks.add(t_idx)
+            matched_detections.add(d_idx)
+
+        # Unmatched detections start new tracks
+        for d_idx, (label, box, conf) in enumerate(detections):
+            if d_idx not in matched_detections:
+                self.tracks.append(Track(next(self._ids), label, box, conf))
+
+        return self.confirmed_tracks()
+
+    @staticmethod
+    def _center_distance(box_a, box_b):
+        ax = (box_a[0] + box_a[2]) / 2.0
+        ay = (box_a[1] + box_a[3]) / 2.0
+        bx = (box_b[0] + box_b[2]) / 2.0
+        by = (box_b[1] + box_b[3]) / 2.0
+        return ((ax - bx) ** 2 + (ay - by) ** 2) ** 0.5
+
+    def confirmed_tracks(self, label=None):
+        """Tracks that have been seen often enough to be trusted"""
+        return [
+            t for t in self.tracks
+            if t.hits >= self.min_hits and (label is None or t.label == label)
+        ]
+
+    def reset(self):
+        self.tracks = []
@@ -0,0 +1,85 @@
+import time
+
+
+class VoteBuffer:
+    """
+    Fixed-size ring buffer of True/False votes with a running true count.
+    push() and confirmed() are O(1) - no list shifting or re-summing.
+
+    If window (seconds) is set, votes older than the window are dropped,
+    so the decision covers a time span instead of a frame count. warmup
+    (seconds) additionally holds back the first decision until votes have
+    been collected for that long, so confirmation latency does not depend
+    on how often push() is called.
+    """
+
+    def __init__(self, size, ratio=0.6, window=None, min_samples=None, warmup=None):
+        self.size = size
+        self.ratio = ratio  # Fraction of True votes needed to confirm
+        self.window = window
+        self.min_samples = size if min_samples is None else min_samples
+        self.warmup = warmup
+        self._started = None  # Time of the first vote since the last clear
+
+        self._values = [False] * size
+        self._times = [0.0] * size
+        self._head = 0  # Index of the oldest vote
+        self._count = 0
+        self.true_count = 0
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def ready(self):
+        """Enough votes collected to make a decision"""
+        if self._count < self.min_samples:
+            return False
+        if self.warmup is None:
+            return True
+        newest = self._times[(self._head + self._count - 1) % self.size]
+        return newest - self._started >= self.warmup
+
+    def _drop_oldest(self):
+        if self._values[self._head]:
+            self.true_count -= 1
+        self._head = (self._head + 1) % self.size
+        self._count -= 1
+
+    def _expire(self, now):
+        while self._count and now - self._times[self._head] > self.window:
+            self._drop_oldest()
+
+    def push(self, value, now=None):
+        """Add a vote and return the confirmed state"""
+        value = bool(value)
+        if now is None:
+            now = time.time()
+
+        if self.window is not None:
+            self._expire(now)
+
+        if self._count == self.size:
+            self._drop_oldest()
+        if self._started is None:
+            self._started = now
+
+        idx = (self._head + self._count) % self.size
+        self._values[idx] = value
+        self._times[idx] = now
+        self._count += 1
+
+        if value:
+            self.true_count += 1
+
+        return self.confirmed()
+
+    def confirmed(self):
+        """True when the buffer is ready and enough votes are True"""
+        return self.ready and self.true_count >= self.ratio * self._count
+
+    def clear(self):
+        self._started = None
+        self._head = 0
+        self._count = 0
+        self.true_count = 0
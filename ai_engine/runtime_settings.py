@@ -0,0 +1,67 @@
+from backend.config import PERFORMANCE_PROFILES
+
+# Setting name → type; every profile must define all of them
+SETTING_TYPES = {
+    "capture_width": int,
+    "capture_height": int,
+    "capture_fps": int,
+    "yolo_interval": int,
+    "yolo_conf": float,
+    "sleep_rate_hz": float,
+    "phone_rate_hz": float,
+    "away_rate_hz": float,
+    "landmark_full_rate_hz": float,
+    "away_threshold": float,
+    "sleep_ear_threshold": float,
+    "min_sleep_time": float,
+    "emit_interval": float,
+}
+
+# Vote windows (seconds) fed by the detector rates. A window has to hold
+# MIN_VOTES samples at its detector's rate, or that detector never decides
+VOTE_WINDOWS = {"sleep": 1.0, "sleep_eyes": 0.7, "phone": 0.5, "away": 3.0}
+MIN_VOTES = 2
+RATE_WINDOWS = {
+    "sleep_rate_hz": min(VOTE_WINDOWS["sleep"], VOTE_WINDOWS["sleep_eyes"]),
+    "phone_rate_hz": VOTE_WINDOWS["phone"],
+    "away_rate_hz": VOTE_WINDOWS["away"],
+}
+
+
+def resolve_settings(profile, overrides=None):
+    """
+    Build a validated settings dict from a named profile plus overrides.
+    Raises ValueError with a readable message on unknown or invalid values.
+    """
+    if profile not in PERFORMANCE_PROFILES:
+        raise ValueError(f"Unknown profile '{profile}' (available: {', '.join(PERFORMANCE_PROFILES)})")
+
+    settings = dict(PERFORMANCE_PROFILES[profile])
+    settings.update(overrides or {})
+
+    missing = [k for k in SETTING_TYPES if k not in settings]
+    if missing:
+        raise ValueError(f"Profile '{profile}' is missing settings: {', '.join(missing)}")
+
+    for key, value in settings.items():
+        if key not in SETTING_TYPES:
+            raise ValueError(f"Unknown setting '{key}'")
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"Setting '{key}' must be a number")
+        if value <= 0:
+            raise ValueError(f"Setting '{key}' must be positive")
+        settings[key] = SETTING_TYPES[key](value)
+
+    if settings["yolo_conf"] >= 1:
+        raise ValueError("Setting 'yolo_conf' must be below 1")
+
+    for key, window in RATE_WINDOWS.items():
+        # Detectors run at most once per frame
+        rate = min(settings[key], settings["capture_fps"])
+        if rate * window < MIN_VOTES:
+            raise ValueError(
+                f"Setting '{key}' (capped at capture_fps) must be at least "
+                f"{round(MIN_VOTES / window, 2):g} Hz to fill its {window:g} s vote window"
+            )
+
+    return settings
@@ -0,0 +1,109 @@
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+
+_NO_SPAN = nullcontext()  # Shared no-op returned while tracing is off
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "cat", "start")
+
+    def __init__(self, tracer, name, cat):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.add(self.name, self.cat, self.start, time.perf_counter_ns())
+        return False
+
+
+class FrameTracer:
+    """
+    Opt-in per-frame tracing for the detection loop.
+
+    While enabled, span() records (name, start, duration) of each stage with
+    monotonic nanosecond timestamps into a bounded ring buffer - old spans are
+    dropped once max_spans is reached. Tracing turns itself off when its
+    window expires. export() returns Chrome trace JSON (chrome://tracing,
+    Perfetto). When disabled, span() returns a shared no-op context.
+    """
+
+    def __init__(self, max_spans=50000):
+        self.spans = deque(maxlen=max_spans)
+        self.enabled = False
+        self.until = None  # time.monotonic() deadline of the current window
+        self.sample_every = 1  # Record every Nth frame
+        self.frames = 0
+        self.recording = False  # Current frame is being sampled
+        self.pid = os.getpid()
+        self.thread_names = {}
+
+    def start(self, seconds, sample_every=1):
+        """Record spans for the next `seconds` seconds, replacing any previous trace"""
+        self.spans.clear()
+        self.sample_every = max(1, int(sample_every))
+        self.until = time.monotonic() + seconds
+        self.enabled = True
+
+    def stop(self):
+        self.enabled = False
+        self.recording = False
+
+    def begin_frame(self):
+        """Called at the top of each frame - decides whether it is sampled"""
+        self.frames += 1
+        if self.enabled and time.monotonic() >= self.until:
+            self.stop()
+        self.recording = self.enabled and self.frames % self.sample_every == 0
+
+    def span(self, name, cat="detector"):
+        if not self.recording:
+            return _NO_SPAN
+        return _Span(self, name, cat)
+
+    def add(self, name, cat, start_ns, end_ns):
+        tid = threading.get_ident()
+        if tid not in self.thread_names:
+            self.thread_names[tid] = threading.current_thread().name
+        self.spans.append((name, cat, start_ns, end_ns - start_ns, tid, self.frames))
+
+    def status(self):
+        remaining = max(0.0, self.until - time.monotonic()) if self.enabled else 0.0
+        return {
+            "enabled": self.enabled,
+            "remaining_s": round(remaining, 1),
+            "sample_every": self.sample_every,
+            "spans": len(self.spans),
+            "max_spans": self.spans.maxlen,
+        }
+
+    def export(self):
+        """Recorded spans as a Chrome trace dict (timestamps in µs)"""
+        events = [
+            {
+                "name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid,
+                "args": {"name": name}
+            }
+            for tid, name in list(self.thread_names.items())
+        ]
+
+        for name, cat, start_ns, dur_ns, tid, frame in list(self.spans):
+            events.append({
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": start_ns / 1000.0,
+                "dur": dur_ns / 1000.0,
+                "pid": self.pid,
+                "tid": tid,
+                "args": {"frame": frame},
+            })
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
@@ -1,19 +1,38 @@
 from flask import Flask
 from flask_cors import CORS
 from flask_socketio import SocketIO
+from backend.config import SOCKETIO_ASYNC_MODE, SOCKETIO_MESSAGE_QUEUE, EVENT_STORE
+
+if EVENT_STORE == "http":
+    # The HTTP store only ships events - the routes below could not read any
+    raise RuntimeError(
+        "EVENT_STORE=http is for detector nodes and cannot serve the backend routes. "
+        "Run this node with run_detector_node.py, or use EVENT_STORE=mongo/sqlite."
+    )
 
 app = Flask(__name__)
 CORS(app, resources={r"/*": {"origins": "*"}})
 
 # Initialize SocketIO with CORS support
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
+socketio = SocketIO(
+    app,
+    cors_allowed_origins="*",
+    async_mode=SOCKETIO_ASYNC_MODE,
+    message_queue=SOCKETIO_MESSAGE_QUEUE
+)
 
 # Import routes after socketio is created to avoid circular imports
 from backend.routes.events_route import events_bp
 from backend.routes.summary_route import summary_bp
+from backend.routes.timeline_route import timeline_bp
+from backend.routes.evidence_route import evidence_bp
+from backend.routes.admin_route import admin_bp
 
 app.register_blueprint(events_bp)
 app.register_blueprint(summary_bp)
+app.register_blueprint(timeline_bp)
+app.register_blueprint(evidence_bp)
+app.register_blueprint(admin_bp)
 
 
 @app.get("/")
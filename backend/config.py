@@ -1,2 +1,62 @@
+import os
+
 MONGO_URI = "mongodb://localhost:27017"
 DB_NAME = "employee_monitoring"
+
+# Connection pool bounds - requests wait for a free connection instead of opening more
+MONGO_MAX_POOL_SIZE = int(os.environ.get("MONGO_MAX_POOL_SIZE", "100"))
+MONGO_WAIT_QUEUE_TIMEOUT_MS = int(os.environ.get("MONGO_WAIT_QUEUE_TIMEOUT_MS", "5000"))
+
+# Socket.IO serving: "threading" (dev server) or "gevent" (run_backend_async.py)
+SOCKETIO_ASYNC_MODE = os.environ.get("SOCKETIO_ASYNC_MODE", "threading")
+# Optional message queue (e.g. redis://localhost:6379) to share sockets across instances
+SOCKETIO_MESSAGE_QUEUE = os.environ.get("SOCKETIO_MESSAGE_QUEUE") or None
+
+# Event store backend: "mongo", "sqlite" (embedded, no server needed)
+# or "http" (detector node shipping batches to a central backend - run_detector_node.py only)
+EVENT_STORE = os.environ.get("EVENT_STORE", "mongo")
+SQLITE_PATH = os.environ.get("SQLITE_PATH", "data/events.db")
+EVENT_BACKEND_URL = os.environ.get("EVENT_BACKEND_URL", "http://127.0.0.1:5000")
+
+# Write-ahead journal: events hit local disk first and are replayed into the store
+USE_EVENT_JOURNAL = os.environ.get("EVENT_JOURNAL", "1") == "1"
+EVENT_JOURNAL_PATH = os.environ.get("EVENT_JOURNAL_PATH", "data/events.journal")
+
+# Evidence snapshots saved on sleep/phone/away start
+EVIDENCE_DIR = os.environ.get("EVIDENCE_DIR", "data/evidence")
+EVIDENCE_MAX_BYTES = int(os.environ.get("EVIDENCE_MAX_BYTES", str(500 * 1024 * 1024)))
+
+# Cold history: days older than RETENTION_DAYS are compacted into columnar archives
+USE_ARCHIVE = os.environ.get("EVENT_ARCHIVE", "1") == "1"
+ARCHIVE_DIR = os.environ.get("ARCHIVE_DIR", "data/archive")
+RETENTION_DAYS = int(os.environ.get("RETENTION_DAYS", "30"))
+
+# Named performance profiles for the detection engine. Any key can be
+# overridden per site through POST /admin/profile without a restart.
+PERFORMANCE_PROFILES = {
+    "low-power": {
+        "capture_width": 640, "capture_height": 360, "capture_fps": 15,
+        "yolo_interval": 12, "yolo_conf": 0.5,
+        "sleep_rate_hz": 5, "phone_rate_hz": 4, "away_rate_hz": 1,
+        "landmark_full_rate_hz": 1,
+        "away_threshold": 5, "sleep_ear_threshold": 0.25, "min_sleep_time": 3,
+        "emit_interval": 10,
+    },
+    "balanced": {
+        "capture_width": 1280, "capture_height": 720, "capture_fps": 30,
+        "yolo_interval": 6, "yolo_conf": 0.5,
+        "sleep_rate_hz": 15, "phone_rate_hz": 10, "away_rate_hz": 1,
+        "landmark_full_rate_hz": 3,
+        "away_threshold": 5, "sleep_ear_threshold": 0.25, "min_sleep_time": 3,
+        "emit_interval": 5,
+    },
+    "accuracy": {
+        "capture_width": 1280, "capture_height": 720, "capture_fps": 30,
+        "yolo_interval": 2, "yolo_conf": 0.4,
+        "sleep_rate_hz": 30, "phone_rate_hz": 15, "away_rate_hz": 2,
+        "landmark_full_rate_hz": 10,
+        "away_threshold": 5, "sleep_ear_threshold": 0.25, "min_sleep_time": 3,
+        "emit_interval": 2,
+    },
+}
+DEFAULT_PROFILE = os.environ.get("PERFORMANCE_PROFILE", "balanced")
@@ -1,7 +1,11 @@
 from pymongo import MongoClient
-from .config import MONGO_URI, DB_NAME
+from .config import MONGO_URI, DB_NAME, MONGO_MAX_POOL_SIZE, MONGO_WAIT_QUEUE_TIMEOUT_MS
 
-client = MongoClient(MONGO_URI)
+client = MongoClient(
+    MONGO_URI,
+    maxPoolSize=MONGO_MAX_POOL_SIZE,
+    waitQueueTimeoutMS=MONGO_WAIT_QUEUE_TIMEOUT_MS
+)
 db = client[DB_NAME]
 
 events_collection = db["events"]
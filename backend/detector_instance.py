@@ -0,0 +1,11 @@
+# This file holds the running DetectionRunner so routes can reach it without circular imports
+detector = None
+
+def init_detector(runner):
+    """Register the running detector (integrated mode only)"""
+    global detector
+    detector = runner
+
+def get_detector():
+    """Get the running detector, or None if detection runs in another process"""
+    return detector
@@ -0,0 +1,63 @@
+import re
+from datetime import datetime
+
+EVENT_TYPES = ("sleep", "phone", "away")
+STATUSES = ("start", "end")
+REQUIRED_FIELDS = ("event_id", "employee_id", "event_type", "status", "timestamp")
+
+# Optional fields a client may send, with the pattern each must match
+OPTIONAL_FIELDS = {
+    "evidence": re.compile(r"\d{4}-\d{2}-\d{2}/[A-Za-z0-9_-]{1,64}\.jpg"),
+}
+
+# IDs end up in file paths (archive, evidence) and URLs - keep them plain
+ID_PATTERN = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+
+def parse_event(raw):
+    """
+    Validate one incoming event dict.
+    Returns (event, None) with timestamp parsed to a naive local datetime,
+    or (None, error message) if the event is malformed or has unknown fields.
+    """
+    if not isinstance(raw, dict):
+        return None, "event must be an object"
+
+    for field in REQUIRED_FIELDS:
+        value = raw.get(field)
+        if not isinstance(value, str) or not value:
+            return None, f"missing or invalid '{field}'"
+
+    for field in ("event_id", "employee_id"):
+        if not ID_PATTERN.fullmatch(raw[field]):
+            return None, f"'{field}' must be 1-64 letters, digits, '_' or '-'"
+
+    unknown = [k for k in raw if k not in REQUIRED_FIELDS and k not in OPTIONAL_FIELDS]
+    if unknown:
+        return None, f"unknown field '{unknown[0]}'"
+
+    for field, pattern in OPTIONAL_FIELDS.items():
+        if field in raw and not (isinstance(raw[field], str) and pattern.fullmatch(raw[field])):
+            return None, f"invalid '{field}'"
+
+    if raw["event_type"] not in EVENT_TYPES:
+        return None, f"unknown event_type '{raw['event_type']}'"
+    if raw["status"] not in STATUSES:
+        return None, f"unknown status '{raw['status']}'"
+
+    try:
+        timestamp = datetime.fromisoformat(raw["timestamp"])
+    except ValueError:
+        return None, "timestamp must be ISO 8601"
+
+    if timestamp.tzinfo is not None:
+        # Stored timestamps are naive local time, like datetime.now() on the detector
+        timestamp = timestamp.astimezone().replace(tzinfo=None)
+
+    # Only known fields reach storage
+    event = {field: raw[field] for field in REQUIRED_FIELDS}
+    event["timestamp"] = timestamp
+    for field in OPTIONAL_FIELDS:
+        if field in raw:
+            event[field] = raw[field]
+    return event, None
@@ -0,0 +1,111 @@
+from flask import Blueprint, jsonify, request
+from backend.config import PERFORMANCE_PROFILES
+import backend.detector_instance as detector_instance
+from backend.services.metrics import metrics
+
+admin_bp = Blueprint("admin", __name__)
+
+
+@admin_bp.get("/admin/profile")
+def get_profile():
+    """Current performance profile, effective settings and available profiles"""
+    detector = detector_instance.get_detector()
+    return jsonify({
+        "running": detector is not None,
+        "profile": detector.profile if detector else None,
+        "settings": detector.settings if detector else None,
+        "profiles": PERFORMANCE_PROFILES,
+    })
+
+
+@admin_bp.post("/admin/profile")
+def set_profile():
+    """
+    Switch profile and/or override settings on the running detector.
+    Body: {"profile": "low-power", "overrides": {"yolo_interval": 10}}
+    Applied between frames - the camera stays open. With the same profile,
+    overrides stack on the current settings; switching profile drops them.
+    """
+    detector = detector_instance.get_detector()
+    if detector is None:
+        return jsonify({"error": "no detector running in this process"}), 503
+
+    body = request.get_json(silent=True) or {}
+    profile = body.get("profile", detector.profile)
+    overrides = body.get("overrides") or {}
+    if not isinstance(overrides, dict):
+        return jsonify({"error": "overrides must be an object"}), 400
+
+    try:
+        settings = detector.apply_settings(profile, overrides)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify({"profile": profile, "settings": settings, "status": "pending"})
+
+
+@admin_bp.get("/metrics")
+def get_metrics():
+    return jsonify(metrics.snapshot())
+
+
+# Longest tracing window a single request can open
+MAX_TRACE_SECONDS = 300
+
+
+@admin_bp.post("/admin/trace")
+def start_trace():
+    """
+    Record per-stage spans of the detection loop for a fixed window.
+    Body: {"seconds": 10, "sample_every": 1}
+    Fetch the result from GET /admin/trace/export once the window ends.
+    """
+    detector = detector_instance.get_detector()
+    if detector is None:
+        return jsonify({"error": "no detector running in this process"}), 503
+
+    body = request.get_json(silent=True) or {}
+    try:
+        seconds = float(body.get("seconds", 10))
+        sample_every = int(body.get("sample_every", 1))
+    except (TypeError, ValueError):
+        return jsonify({"error": "seconds and sample_every must be numbers"}), 400
+
+    if not 0 < seconds <= MAX_TRACE_SECONDS:
+        return jsonify({"error": f"seconds must be between 0 and {MAX_TRACE_SECONDS}"}), 400
+    if sample_every < 1:
+        return jsonify({"error": "sample_every must be at least 1"}), 400
+
+    detector.tracer.start(seconds, sample_every)
+    metrics.record_change("trace", {"seconds": seconds, "sample_every": sample_every})
+    return jsonify(detector.tracer.status())
+
+
+@admin_bp.get("/admin/trace")
+def trace_status():
+    detector = detector_instance.get_detector()
+    if detector is None:
+        return jsonify({"error": "no detector running in this process"}), 503
+    return jsonify(detector.tracer.status())
+
+
+@admin_bp.delete("/admin/trace")
+def stop_trace():
+    """End the tracing window early (recorded spans are kept for export)"""
+    detector = detector_instance.get_detector()
+    if detector is None:
+        return jsonify({"error": "no detector running in this process"}), 503
+    detector.tracer.stop()
+    return jsonify(detector.tracer.status())
+
+
+@admin_bp.get("/admin/trace/export")
+def export_trace():
+    """Recorded spans as Chrome trace JSON - open in chrome://tracing or Perfetto"""
+    detector = detector_instance.get_detector()
+    if detector is None:
+        return jsonify({"error": "no detector running in this process"}), 503
+
+    response = jsonify(detector.tracer.export())
+    response.headers["Content-Disposition"] = "attachment; filename=detector-trace.json"
+    return response
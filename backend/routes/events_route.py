@@ -1,23 +1,28 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
 from datetime import datetime
-from backend.database import events_collection
+import json
+import zlib
+from backend.storage import get_event_store
+from backend.services.event_ingestor import EventIngestor
+from backend.utils.time_utils import day_bounds
 
 events_bp = Blueprint("events", __name__)
+ingestor = EventIngestor()
+
+MAX_BATCH_BYTES = 32 * 1024 * 1024  # Size limit for one batch, as uploaded and decompressed
+
+
+class BatchTooLarge(ValueError):
+    pass
 
 
 @events_bp.get("/events/today/<employee_id>")
 def get_today_events(employee_id):
-    """Get all events for today from MongoDB"""
-    today = datetime.now().date()
-
-    # Query MongoDB for today's events
-    events = list(events_collection.find({
-        "employee_id": employee_id,
-        "timestamp": {
-            "$gte": datetime(today.year, today.month, today.day),
-            "$lt": datetime(today.year, today.month, today.day + 1)
-        }
-    }, {"_id": 0}))  # Exclude MongoDB _id field
+    """Get all events for today from the event store"""
+    start, end = day_bounds()
+
+    # Query the event store for today's events
+    events = get_event_store().find_events(employee_id, start, end)
 
     # Convert datetime objects to ISO format strings
     for event in events:
@@ -33,16 +38,10 @@ def get_live_status(employee_id):
     Returns the last known current state (sleep/phone/away)
     based on the most recent events in the database
     """
-    today = datetime.now().date()
+    start, end = day_bounds()
 
-    # Get all today's events
-    events = list(events_collection.find({
-        "employee_id": employee_id,
-        "timestamp": {
-            "$gte": datetime(today.year, today.month, today.day),
-            "$lt": datetime(today.year, today.month, today.day + 1)
-        }
-    }).sort("timestamp", -1))  # Sort by timestamp descending
+    # Get all today's events (oldest first)
+    events = get_event_store().find_events(employee_id, start, end)
 
     # Initialize status
     live_state = {"sleep": False, "phone": False, "away": False}
@@ -51,7 +50,7 @@ def get_live_status(employee_id):
     # We need to find the most recent start/end for each event type
     event_states = {}
 
-    for event in reversed(events):  # Process in chronological order
+    for event in events:  # Process in chronological order
         event_type = event["event_type"]
         status = event["status"]
 
@@ -65,4 +64,47 @@ def get_live_status(employee_id):
         if event_type in live_state:
             live_state[event_type] = is_active
 
-    return jsonify(live_state)
\ No newline at end of file
+    return jsonify(live_state)
+
+
+def _read_batch_body():
+    """Decode a JSON body that may be gzip/deflate compressed"""
+    # Refuse oversized uploads before reading them into memory
+    if request.content_length is not None and request.content_length > MAX_BATCH_BYTES:
+        raise BatchTooLarge("batch too large")
+    body = request.stream.read(MAX_BATCH_BYTES + 1)
+    if len(body) > MAX_BATCH_BYTES:
+        raise BatchTooLarge("batch too large")
+
+    encoding = request.headers.get("Content-Encoding", "").lower()
+    if encoding in ("gzip", "deflate"):
+        # wbits 47 auto-detects gzip or zlib headers
+        decompressor = zlib.decompressobj(47)
+        body = decompressor.decompress(body, MAX_BATCH_BYTES)
+        if decompressor.unconsumed_tail:
+            raise BatchTooLarge("batch too large")
+
+    return json.loads(body)
+
+
+@events_bp.post("/events/batch")
+def ingest_event_batch():
+    """
+    Bulk ingestion for remote detector nodes.
+    Body: {"events": [...]} or a plain list, optionally gzip-compressed.
+    """
+    try:
+        payload = _read_batch_body()
+    except BatchTooLarge as e:
+        return jsonify({"error": f"invalid batch: {e}"}), 413
+    except (ValueError, zlib.error) as e:
+        return jsonify({"error": f"invalid batch: {e}"}), 400
+
+    events = payload.get("events") if isinstance(payload, dict) else payload
+    if not isinstance(events, list):
+        return jsonify({"error": "expected a list of events"}), 400
+    if len(events) > ingestor.max_batch:
+        return jsonify({"error": f"batch exceeds {ingestor.max_batch} events"}), 413
+
+    result = ingestor.ingest(events)
+    return jsonify(result)
@@ -0,0 +1,11 @@
+from flask import Blueprint, send_from_directory
+import os
+from backend.config import EVIDENCE_DIR
+
+evidence_bp = Blueprint("evidence", __name__)
+
+
+@evidence_bp.get("/evidence/<path:relative_path>")
+def get_evidence(relative_path):
+    """Serve an evidence snapshot linked from an event's "evidence" field"""
+    return send_from_directory(os.path.abspath(EVIDENCE_DIR), relative_path, mimetype="image/jpeg")
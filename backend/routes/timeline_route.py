@@ -0,0 +1,40 @@
+from flask import Blueprint, jsonify, request
+from datetime import datetime, timedelta
+from backend.storage import get_event_store
+from backend.services.timeline_builder import TimelineBuilder
+from backend.utils.time_utils import day_bounds
+
+timeline_bp = Blueprint("timeline", __name__)
+tb = TimelineBuilder()
+
+# range name → (days covered, default bucket size in seconds)
+RANGES = {
+    "day": (1, 60),
+    "week": (7, 3600),
+}
+
+
+@timeline_bp.get("/timeline/<employee_id>")
+def get_timeline(employee_id):
+    """
+    Merged activity intervals as columnar arrays.
+    Query: range=day|week (default day), resolution=<seconds> (optional)
+    """
+    range_name = request.args.get("range", "day")
+    if range_name not in RANGES:
+        return jsonify({"error": f"range must be one of {sorted(RANGES)}"}), 400
+
+    days, default_resolution = RANGES[range_name]
+    resolution = request.args.get("resolution", default_resolution, type=int)
+    if not resolution or resolution < 1:
+        return jsonify({"error": "resolution must be a positive number of seconds"}), 400
+
+    # Ranges end at the end of today and reach back whole days
+    _, end = day_bounds()
+    start = end - timedelta(days=days)
+
+    events = get_event_store().find_events(employee_id, start, end)
+    timeline = tb.build(events, start, end, resolution, now=datetime.now())
+    timeline["employee_id"] = employee_id
+
+    return jsonify(timeline)
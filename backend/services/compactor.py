@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+
+from backend.storage.archive import event_key
+
+
+class EventCompactor:
+    """
+    Moves days older than the retention window from the hot store into
+    the columnar archive, one employee-day at a time. A day is archived
+    (merged with anything already archived for it) before its hot events
+    are deleted, so an interrupted run can simply be repeated. Only the
+    events that were read are deleted - late arrivals written meanwhile
+    stay in the hot store for the next run.
+    """
+
+    def __init__(self, store, archive, retention_days=30):
+        self.store = store  # Hot store (not the tiered wrapper)
+        self.archive = archive
+        self.retention_days = retention_days
+
+    def run(self, now=None):
+        """Compact everything before the cutoff. Returns a stats dict"""
+        now = now or datetime.now()
+        cutoff = datetime(now.year, now.month, now.day) - timedelta(days=self.retention_days)
+
+        stats = {"days": 0, "events": 0, "archived_bytes": 0, "skipped": 0}
+
+        oldest = self.store.oldest_timestamp()
+        if oldest is None or oldest >= cutoff:
+            return stats
+
+        day = datetime(oldest.year, oldest.month, oldest.day)
+        while day < cutoff:
+            next_day = day + timedelta(days=1)
+
+            for employee_id in self.store.employee_ids(day, next_day):
+                if not self.archive.archivable(employee_id):
+                    # Left in the hot store - aborting here would block every later day
+                    print(f"[COMPACTOR] Skipping unarchivable employee_id {employee_id!r} on {day:%Y-%m-%d}")
+                    stats["skipped"] += 1
+                    continue
+
+                hot_events = self.store.find_events(employee_id, day, next_day)
+
+                events = self.archive.read_day(employee_id, day)
+                if events:
+                    # Late arrivals for an already archived day (or a rerun after a crash)
+                    archived = {event_key(e) for e in events}
+                    events.extend(e for e in hot_events if event_key(e) not in archived)
+                    events.sort(key=lambda e: e["timestamp"])
+                else:
+                    events = hot_events
+
+                stats["archived_bytes"] += self.archive.write_day(employee_id, day, events)
+                self.store.delete_events(
+                    employee_id, day, next_day,
+                    event_ids=[e["event_id"] for e in hot_events if e.get("event_id")]
+                )
+
+                stats["days"] += 1
+                stats["events"] += len(hot_events)
+
+            day = next_day
+
+        return stats
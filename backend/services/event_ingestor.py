@@ -0,0 +1,64 @@
+import threading
+from collections import OrderedDict
+
+from backend.models.event_model import parse_event
+from backend.storage import get_event_store
+
+
+class EventIngestor:
+    """
+    Validates and stores event batches sent by remote detector nodes.
+    Duplicates are dropped by event_id, first against a bounded cache of
+    recently stored IDs and then by the store's unique index.
+    """
+
+    def __init__(self, max_batch=5000, recent_ids=200000):
+        self.max_batch = max_batch
+        self.recent_limit = recent_ids
+        self.recent = OrderedDict()  # event_id → None, oldest first
+        self.lock = threading.Lock()
+
+    def _seen(self, event_id):
+        with self.lock:
+            return event_id in self.recent
+
+    def _remember(self, event_ids):
+        with self.lock:
+            for event_id in event_ids:
+                self.recent[event_id] = None
+            while len(self.recent) > self.recent_limit:
+                self.recent.popitem(last=False)
+
+    def ingest(self, raw_events):
+        """Returns counts of accepted/duplicate events and per-index errors"""
+        events = []
+        batch_ids = set()
+        duplicates = 0
+        rejected = []
+
+        for index, raw in enumerate(raw_events):
+            event, error = parse_event(raw)
+            if error:
+                rejected.append({"index": index, "error": error})
+                continue
+
+            event_id = event["event_id"]
+            if event_id in batch_ids or self._seen(event_id):
+                duplicates += 1
+                continue
+
+            batch_ids.add(event_id)
+            events.append(event)
+
+        if events:
+            # One bulk write, durable before we acknowledge the batch
+            store = get_event_store()
+            store.insert_events(events)
+            store.flush()
+            self._remember(e["event_id"] for e in events)
+
+        return {
+            "accepted": len(events),
+            "duplicates": duplicates,
+            "rejected": rejected
+        }
@@ -1,13 +1,21 @@
 from datetime import datetime
-from backend.database import events_collection
+from backend.storage import get_event_store, get_event_journal
 import backend.socket_instance as socket_instance
 import time
+import uuid
+from contextlib import nullcontext
 
 
 class EventLogger:
 
     def __init__(self, employee_id="001"):
         self.employee_id = employee_id
+        self.store = get_event_store()
+        self.journal = get_event_journal()  # None → write straight to the store
+
+        # Called with each "start" event; returns an evidence snapshot path or None
+        self.evidence_hook = None
+        self.tracer = None  # Optional FrameTracer for journal/DB write latency
         self.current_events = {
             "sleep": False,
             "phone": False,
@@ -39,15 +47,28 @@ class EventLogger:
                 self.last_emit_time = current_time
 
     def _write_event(self, event_type, status):
-        """Write event to database"""
+        """Write event to the journal (replayed into the database) or the database"""
         event = {
+            "event_id": uuid.uuid4().hex,
             "employee_id": self.employee_id,
             "event_type": event_type,
             "status": status,
             "timestamp": datetime.now()
         }
 
-        events_collection.insert_one(event)
+        if status == "start" and self.evidence_hook:
+            evidence = self.evidence_hook(event)
+            if evidence:
+                event["evidence"] = evidence
+
+        if self.journal is not None:
+            with self.tracer.span("journal.append", "io") if self.tracer else nullcontext():
+                self.journal.append(event)
+            print(f"[EVENT → JOURNAL] {event_type} - {status}")
+            return
+
+        with self.tracer.span("db.insert", "io") if self.tracer else nullcontext():
+            self.store.insert_event(event)
         print(f"[EVENT → DB] {event_type} - {status}")
 
     def handle_event(self, event_type, active):
@@ -0,0 +1,41 @@
+import threading
+import time
+from collections import deque
+
+
+class Metrics:
+    """
+    In-process counters, gauges and a short log of notable changes
+    (e.g. runtime reconfiguration), served by GET /metrics.
+    """
+
+    def __init__(self, max_changes=100):
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.gauges = {}
+        self.changes = deque(maxlen=max_changes)
+
+    def incr(self, name, value=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def gauge(self, name, value):
+        with self.lock:
+            self.gauges[name] = value
+
+    def record_change(self, kind, details):
+        with self.lock:
+            self.changes.append({"time": time.time(), "kind": kind, **details})
+            self.counters[f"{kind}.count"] = self.counters.get(f"{kind}.count", 0) + 1
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "counters": dict(self.counters),
+                "gauges": dict(self.gauges),
+                "changes": list(self.changes),
+            }
+
+
+# Shared instance for the whole process
+metrics = Metrics()
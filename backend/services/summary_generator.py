@@ -1,19 +1,15 @@
 from datetime import datetime, timedelta
-from backend.database import events_collection
+from backend.storage import get_event_store
+from backend.utils.time_utils import day_bounds
 
 class SummaryGenerator:
 
     def generate_summary(self, employee_id="001"):
         today = datetime.now().date()
 
-        # Fetch all today's events from DB
-        events = list(events_collection.find({
-            "employee_id": employee_id,
-            "timestamp": {
-                "$gte": datetime(today.year, today.month, today.day),
-                "$lt": datetime(today.year, today.month, today.day) + timedelta(days=1)
-            }
-        }))
+        # Fetch all today's events from the event store (oldest first)
+        start, end = day_bounds(today)
+        events = get_event_store().find_events(employee_id, start, end)
 
         if not events:
             return {
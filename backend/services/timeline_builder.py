@@ -0,0 +1,92 @@
+from datetime import datetime
+
+from backend.models.event_model import EVENT_TYPES
+
+MAX_BUCKETS = 2000  # Upper bound on buckets per request, whatever resolution is asked for
+
+
+class TimelineBuilder:
+    """
+    Turns start/end events into closed intervals and merges them at a
+    bucket resolution, so the payload size depends on the time range
+    and resolution rather than on how many events were recorded.
+    """
+
+    def build_intervals(self, events, range_start, range_end, now=None):
+        """
+        Pair start/end events (oldest first) per event type.
+        Returns {event_type: [(start, end, is_open), ...]} clipped to the range.
+        An end with no start in range began before the range; a start with
+        no end is still running and is closed at now.
+        """
+        if now is None:
+            now = datetime.now()
+        open_until = min(now, range_end)
+
+        intervals = {t: [] for t in EVENT_TYPES}
+        started = {}
+        seen = set()
+
+        for e in events:
+            event_type = e["event_type"]
+            if event_type not in intervals:
+                continue
+
+            if e["status"] == "start":
+                if event_type not in started:
+                    started[event_type] = e["timestamp"]
+            elif e["status"] == "end":
+                start = started.pop(event_type, None)
+                if start is None and event_type not in seen:
+                    start = range_start
+                if start is not None:
+                    intervals[event_type].append((start, e["timestamp"], False))
+
+            seen.add(event_type)
+
+        for event_type, start in started.items():
+            if start < open_until:
+                intervals[event_type].append((start, open_until, True))
+
+        return intervals
+
+    def merge(self, intervals, range_start, resolution):
+        """
+        Snap intervals outward to resolution-second buckets and merge
+        overlapping or touching ones. Returns columnar offsets (seconds from
+        range_start) plus whether the last interval is still open.
+        """
+        starts = []
+        ends = []
+        is_open = False
+
+        for start, end, open_ in sorted(intervals):
+            s = int((start - range_start).total_seconds()) // resolution * resolution
+            e = -(-int((end - range_start).total_seconds()) // resolution) * resolution
+            e = max(e, s + resolution)
+
+            if ends and s <= ends[-1]:
+                ends[-1] = max(ends[-1], e)
+            else:
+                starts.append(max(s, 0))
+                ends.append(e)
+            is_open = open_
+
+        return {"start": starts, "end": ends, "open": is_open}
+
+    def build(self, events, range_start, range_end, resolution, now=None):
+        """Columnar timeline for all event types"""
+        span = int((range_end - range_start).total_seconds())
+        resolution = max(int(resolution), 1, -(-span // MAX_BUCKETS))
+
+        intervals = self.build_intervals(events, range_start, range_end, now)
+
+        return {
+            "range_start": range_start.isoformat(),
+            "range_end": range_end.isoformat(),
+            "resolution": resolution,
+            "types": {
+                event_type: self.merge(items, range_start, resolution)
+                for event_type, items in intervals.items()
+            }
+        }
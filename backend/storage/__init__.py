@@ -0,0 +1,61 @@
+import threading
+
+from backend.config import (
+    EVENT_STORE, SQLITE_PATH, EVENT_BACKEND_URL, USE_EVENT_JOURNAL, EVENT_JOURNAL_PATH,
+    USE_ARCHIVE, ARCHIVE_DIR
+)
+
+_store = None
+_journal = None
+_store_lock = threading.Lock()
+_journal_lock = threading.Lock()
+
+
+def create_event_store(kind=None, path=None):
+    """Build a new event store of the given kind ("mongo", "sqlite" or "http")"""
+    kind = kind or EVENT_STORE
+
+    if kind == "mongo":
+        from backend.storage.mongo_store import MongoEventStore
+        return MongoEventStore()
+    if kind == "sqlite":
+        from backend.storage.sqlite_store import SQLiteEventStore
+        return SQLiteEventStore(path or SQLITE_PATH)
+    if kind == "http":
+        from backend.storage.http_store import HttpEventStore
+        return HttpEventStore(EVENT_BACKEND_URL)
+
+    raise ValueError(f"Unknown event store: {kind}")
+
+
+def get_event_store():
+    """Shared event store used by the logger, routes and summaries"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = create_event_store()
+                if USE_ARCHIVE and EVENT_STORE != "http":
+                    # Reads transparently include compacted history
+                    from backend.storage.archive import EventArchive, TieredEventStore
+                    _store = TieredEventStore(_store, EventArchive(ARCHIVE_DIR))
+    return _store
+
+
+def set_event_store(store):
+    """Replace the shared event store (e.g. an in-memory SQLite store for tests)"""
+    global _store
+    _store = store
+
+
+def get_event_journal():
+    """Shared write-ahead journal in front of the event store (None if disabled)"""
+    global _journal
+    if not USE_EVENT_JOURNAL:
+        return None
+    if _journal is None:
+        with _journal_lock:
+            if _journal is None:
+                from backend.storage.journal import EventJournal
+                _journal = EventJournal(EVENT_JOURNAL_PATH, get_event_store())
+    return _journal
@@ -0,0 +1,176 @@
+import json
+import os
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from backend.models.event_model import EVENT_TYPES, STATUSES
+from backend.storage.base import EventStore
+
+# One archived event: delta-encoded timestamp (µs) plus type/status codes
+RECORD_DTYPE = np.dtype([("dt", "<i8"), ("type", "u1"), ("status", "u1")])
+
+TYPE_CODES = {name: i for i, name in enumerate(EVENT_TYPES)}
+STATUS_CODES = {name: i for i, name in enumerate(STATUSES)}
+
+
+def event_key(event):
+    """Identity of an event that survives archiving (archives drop event_id)"""
+    return (int(round(event["timestamp"].timestamp() * 1e6)), event["event_type"], event["status"])
+
+
+class EventArchive:
+    """
+    Columnar per-employee/per-day archive for cold event history.
+
+    Each day is one .npy file of fixed-size records (10 bytes per event)
+    that can be memory-mapped. Timestamps are microseconds, stored as the
+    first value followed by deltas. Fields beyond the core schema (e.g.
+    evidence links) go to a small JSON sidecar keyed by row.
+    Layout: <directory>/<employee_id>/<YYYY-MM-DD>.npy
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def archivable(employee_id):
+        """employee_id can be used as a directory name"""
+        return bool(employee_id) and "/" not in employee_id and "\\" not in employee_id \
+            and not employee_id.startswith(".")
+
+    def _path(self, employee_id, day, suffix=".npy"):
+        if not self.archivable(employee_id):
+            raise ValueError(f"Invalid employee_id for archive: {employee_id!r}")
+        return os.path.join(self.directory, employee_id, f"{day:%Y-%m-%d}{suffix}")
+
+    def has_day(self, employee_id, day):
+        # IDs that can't be archived never were
+        return self.archivable(employee_id) and os.path.exists(self._path(employee_id, day))
+
+    def write_day(self, employee_id, day, events):
+        """Archive one employee's events for one day (oldest first). Returns bytes written"""
+        records = np.zeros(len(events), dtype=RECORD_DTYPE)
+        extras = {}
+
+        micros = np.array([int(round(e["timestamp"].timestamp() * 1e6)) for e in events], dtype=np.int64)
+        if len(micros):
+            records["dt"][0] = micros[0]
+            records["dt"][1:] = np.diff(micros)
+
+        for i, e in enumerate(events):
+            records["type"][i] = TYPE_CODES[e["event_type"]]
+            records["status"][i] = STATUS_CODES[e["status"]]
+
+            extra = {k: v for k, v in e.items()
+                     if k not in ("employee_id", "event_type", "status", "timestamp", "event_id", "_id")}
+            if extra:
+                extras[str(i)] = extra
+
+        path = self._path(employee_id, day)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        written = 0
+        if extras:
+            extra_path = self._path(employee_id, day, ".extra.json")
+            with open(extra_path + ".tmp", "w") as f:
+                json.dump(extras, f, default=str)
+            os.replace(extra_path + ".tmp", extra_path)
+            written += os.path.getsize(extra_path)
+        elif os.path.exists(self._path(employee_id, day, ".extra.json")):
+            os.remove(self._path(employee_id, day, ".extra.json"))
+
+        # The .npy appears last, so a day only counts as archived once complete
+        with open(path + ".tmp", "wb") as f:
+            np.save(f, records)
+        os.replace(path + ".tmp", path)
+
+        return written + os.path.getsize(path)
+
+    def read_day(self, employee_id, day):
+        """Events for one archived day as event dicts, oldest first"""
+        if not self.has_day(employee_id, day):
+            return []
+        path = self._path(employee_id, day)
+
+        records = np.load(path, mmap_mode="r")
+        micros = np.cumsum(records["dt"]).tolist()
+        types = records["type"].tolist()
+        statuses = records["status"].tolist()
+
+        extras = {}
+        extra_path = self._path(employee_id, day, ".extra.json")
+        if os.path.exists(extra_path):
+            with open(extra_path) as f:
+                extras = json.load(f)
+
+        events = []
+        for i in range(len(records)):
+            event = {
+                "employee_id": employee_id,
+                "event_type": EVENT_TYPES[types[i]],
+                "status": STATUSES[statuses[i]],
+                "timestamp": datetime.fromtimestamp(micros[i] // 1000000)
+                + timedelta(microseconds=micros[i] % 1000000),
+            }
+            if str(i) in extras:
+                event.update(extras[str(i)])
+            events.append(event)
+
+        return events
+
+
+class TieredEventStore(EventStore):
+    """
+    Hot store for recent events plus the columnar archive for old days.
+    Writes go to the hot store; reads merge both, so routes and summaries
+    don't need to know where a day lives. A day can briefly exist in both
+    while being compacted, so hot events already in the archive are skipped.
+    """
+
+    def __init__(self, hot, archive):
+        self.hot = hot
+        self.archive = archive
+
+    def insert_event(self, event):
+        self.hot.insert_event(event)
+
+    def insert_events(self, events):
+        self.hot.insert_events(events)
+
+    def find_events(self, employee_id, start, end):
+        events = []
+
+        day = datetime(start.year, start.month, start.day)
+        while day < end:
+            if self.archive.has_day(employee_id, day):
+                events.extend(
+                    e for e in self.archive.read_day(employee_id, day)
+                    if start <= e["timestamp"] < end
+                )
+            day += timedelta(days=1)
+
+        hot_events = self.hot.find_events(employee_id, start, end)
+        if not events:
+            return hot_events
+
+        archived = {event_key(e) for e in events}
+        events.extend(e for e in hot_events if event_key(e) not in archived)
+        events.sort(key=lambda e: e["timestamp"])
+        return events
+
+    def employee_ids(self, start, end):
+        return self.hot.employee_ids(start, end)
+
+    def oldest_timestamp(self):
+        return self.hot.oldest_timestamp()
+
+    def delete_events(self, employee_id, start, end, event_ids=None):
+        return self.hot.delete_events(employee_id, start, end, event_ids)
+
+    def flush(self):
+        self.hot.flush()
+
+    def close(self):
+        self.hot.close()
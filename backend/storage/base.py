@@ -0,0 +1,40 @@
+class EventStore:
+    """
+    Interface every event storage backend implements.
+    Events are dicts with employee_id, event_type, status and a
+    datetime timestamp; extra keys are stored as-is.
+    """
+
+    def insert_event(self, event):
+        raise NotImplementedError
+
+    def insert_events(self, events):
+        """Insert many events in one operation"""
+        for event in events:
+            self.insert_event(event)
+
+    def find_events(self, employee_id, start, end):
+        """Events for one employee with start <= timestamp < end, oldest first"""
+        raise NotImplementedError
+
+    def employee_ids(self, start, end):
+        """Distinct employee IDs with events in [start, end)"""
+        raise NotImplementedError
+
+    def oldest_timestamp(self):
+        """Timestamp of the oldest stored event, or None if empty"""
+        raise NotImplementedError
+
+    def delete_events(self, employee_id, start, end, event_ids=None):
+        """
+        Remove one employee's events in [start, end). Returns number removed.
+        With event_ids, only events with those IDs (or with no ID, i.e. legacy
+        rows) are removed, so events written in the meantime survive.
+        """
+        raise NotImplementedError
+
+    def flush(self):
+        """Write out anything buffered (no-op for unbuffered stores)"""
+
+    def close(self):
+        self.flush()
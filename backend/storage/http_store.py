@@ -0,0 +1,109 @@
+import atexit
+import gzip
+import json
+import threading
+import time
+import urllib.request
+import uuid
+from collections import OrderedDict
+
+from backend.storage.base import EventStore
+
+
+class HttpEventStore(EventStore):
+    """
+    Client-side store for remote detector nodes.
+    Buffers events and ships them gzip-compressed to a central backend's
+    POST /events/batch. Pending events are keyed by event_id, so journal
+    replays of the same events after a failed send do not pile up.
+    """
+
+    def __init__(self, base_url, batch_size=1000, flush_interval=1.0, timeout=10):
+        self.url = base_url.rstrip("/") + "/events/batch"
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.timeout = timeout
+
+        self.lock = threading.Lock()
+        self.pending = OrderedDict()  # event_id → JSON-ready event
+        self.last_flush = time.time()
+        self.running = True
+
+        self.flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        self.flusher.start()
+
+        atexit.register(self.close)
+
+    @staticmethod
+    def _encode(event):
+        event = {k: v for k, v in event.items() if k != "_id"}
+        event.setdefault("event_id", uuid.uuid4().hex)
+        if hasattr(event.get("timestamp"), "isoformat"):
+            event["timestamp"] = event["timestamp"].isoformat()
+        return event
+
+    def _post(self, events):
+        body = gzip.compress(json.dumps({"events": events}, default=str).encode("utf-8"))
+        req = urllib.request.Request(
+            self.url,
+            data=body,
+            method="POST",
+            headers={"Content-Type": "application/json", "Content-Encoding": "gzip"}
+        )
+        with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+            result = json.loads(resp.read())
+
+        if result.get("rejected"):
+            print(f"[EVENT CLIENT] Backend rejected {len(result['rejected'])} events: "
+                  f"{result['rejected'][:3]}")
+
+    def insert_event(self, event):
+        self.insert_events([event])
+
+    def insert_events(self, events):
+        with self.lock:
+            for event in events:
+                event = self._encode(event)
+                self.pending[event["event_id"]] = event
+            should_flush = (len(self.pending) >= self.batch_size
+                            or time.time() - self.last_flush >= self.flush_interval)
+
+        if should_flush:
+            try:
+                self.flush()
+            except Exception as e:
+                # Kept in pending - the background flusher retries
+                print(f"[EVENT CLIENT] Send failed, will retry: {e}")
+
+    def flush(self):
+        """Send everything pending. Raises if the backend can't be reached"""
+        while True:
+            with self.lock:
+                if not self.pending:
+                    self.last_flush = time.time()
+                    return
+                batch = list(self.pending.values())[:self.batch_size]
+
+            self._post(batch)
+
+            with self.lock:
+                for event in batch:
+                    self.pending.pop(event["event_id"], None)
+
+    def _flush_loop(self):
+        while self.running:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"[EVENT CLIENT] Send failed, will retry: {e}")
+
+    def find_events(self, employee_id, start, end):
+        raise NotImplementedError("Remote detector nodes do not read events - query the backend")
+
+    def close(self):
+        self.running = False
+        try:
+            self.flush()
+        except Exception as e:
+            print(f"[EVENT CLIENT] {len(self.pending)} events not sent on shutdown: {e}")
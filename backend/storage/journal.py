@@ -0,0 +1,189 @@
+import atexit
+import json
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+
+
+class EventJournal:
+    """
+    Local append-only write-ahead journal for events.
+
+    append() writes one JSON line and returns immediately; a background
+    thread fsyncs new lines in groups, then replays them into the event
+    store in bulk. The shipped byte offset is saved next to the journal,
+    so after a restart replay resumes where it stopped. Every event carries
+    a client-generated event_id and the stores ignore duplicates, so
+    re-shipping after a crash is harmless.
+    """
+
+    def __init__(self, path, store, sync_interval=0.2, batch_size=500,
+                 max_bytes=16 * 1024 * 1024, retry_delay=5.0):
+        self.path = path
+        self.offset_path = path + ".offset"
+        self.store = store
+
+        self.sync_interval = sync_interval  # Seconds between group fsync/replay passes
+        self.batch_size = batch_size  # Max events per bulk write
+        self.max_bytes = max_bytes  # Truncate the journal once fully shipped past this size
+        self.retry_delay = retry_delay  # Back-off while the store is unavailable
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.file = open(path, "ab")
+        self.dirty = False
+        self.offset = self._load_offset()
+
+        self.running = True
+        self.store_healthy = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+        # atexit runs newest first - the store was created before us, so it
+        # is still open for the final replay
+        atexit.register(self.close)
+
+    # ----- writer side -----
+
+    def append(self, event):
+        """Record an event locally. Never blocks on the database"""
+        event = dict(event)
+        event.setdefault("event_id", uuid.uuid4().hex)
+
+        line = json.dumps(self._encode(event), default=str).encode("utf-8") + b"\n"
+        with self.lock:
+            self.file.write(line)
+            self.file.flush()  # Into the OS page cache; fsync happens in the background
+            self.dirty = True
+
+        return event["event_id"]
+
+    @staticmethod
+    def _encode(event):
+        if isinstance(event.get("timestamp"), datetime):
+            event["timestamp"] = event["timestamp"].isoformat()
+        return event
+
+    @staticmethod
+    def _decode(event):
+        if isinstance(event.get("timestamp"), str):
+            event["timestamp"] = datetime.fromisoformat(event["timestamp"])
+        return event
+
+    # ----- replay side -----
+
+    def _load_offset(self):
+        try:
+            with open(self.offset_path) as f:
+                offset = int(f.read().strip() or 0)
+        except (OSError, ValueError):
+            return 0
+
+        # Journal was truncated or replaced underneath the offset file
+        return min(offset, os.path.getsize(self.path))
+
+    def _save_offset(self):
+        tmp = self.offset_path + ".tmp"
+        with open(tmp, "w") as f:
+            f.write(str(self.offset))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.offset_path)
+
+    def _sync(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            self.dirty = False
+            fileno = self.file.fileno()
+        os.fsync(fileno)
+
+    def _read_batch(self):
+        """Read up to batch_size complete lines after the shipped offset"""
+        events = []
+        end = self.offset
+
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Partial line still being written
+                line_start = end
+                end += len(line)
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    events.append(self._decode(json.loads(line)))
+                except ValueError:
+                    print(f"[JOURNAL] Skipping corrupt line at offset {line_start}")
+                if len(events) >= self.batch_size:
+                    break
+
+        return events, end
+
+    def replay(self):
+        """Ship everything pending to the store. Returns number of events shipped"""
+        shipped = 0
+
+        while True:
+            events, end = self._read_batch()
+            if end == self.offset:
+                break
+
+            if events:
+                self.store.insert_events(events)
+                self.store.flush()  # Must be durable before we move the offset
+
+            self.offset = end
+            self._save_offset()
+            shipped += len(events)
+
+        self._maybe_truncate()
+        return shipped
+
+    def _maybe_truncate(self):
+        with self.lock:
+            if self.offset < self.max_bytes:
+                return
+            if os.path.getsize(self.path) != self.offset:
+                return  # New lines arrived after the last replay
+            self.file.truncate(0)
+            self.offset = 0
+            self._save_offset()
+
+    def pending_bytes(self):
+        return os.path.getsize(self.path) - self.offset
+
+    def _run(self):
+        while self.running:
+            time.sleep(self.sync_interval)
+            try:
+                self._sync()
+                self.replay()
+                if not self.store_healthy:
+                    print("[JOURNAL] Event store reachable again - backlog replayed")
+                self.store_healthy = True
+            except Exception as e:
+                if self.store_healthy:
+                    print(f"[JOURNAL] Event store unavailable, buffering locally: {e}")
+                self.store_healthy = False
+                time.sleep(self.retry_delay)
+
+    def close(self):
+        """Stop the background thread after a final sync and replay attempt"""
+        if self.file.closed:
+            return
+        self.running = False
+        self.thread.join(timeout=self.sync_interval + self.retry_delay + 1)
+        try:
+            self._sync()
+            self.replay()
+        except Exception as e:
+            print(f"[JOURNAL] Final replay failed, will resume on restart: {e}")
+        with self.lock:
+            self.file.close()
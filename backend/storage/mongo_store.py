@@ -0,0 +1,64 @@
+from backend.storage.base import EventStore
+
+
+class MongoEventStore(EventStore):
+    """Event store backed by the MongoDB events collection"""
+
+    def __init__(self):
+        # Imported lazily so SQLite-only nodes never need pymongo
+        from backend.database import events_collection
+        self.collection = events_collection
+        self.indexes_ready = False
+
+    def _ensure_indexes(self):
+        # Created on first write so constructing the store never needs a live server
+        if self.indexes_ready:
+            return
+        self.collection.create_index("event_id", unique=True, sparse=True)
+        self.collection.create_index([("employee_id", 1), ("timestamp", 1)])
+        self.indexes_ready = True
+
+    def insert_event(self, event):
+        self.insert_events([event])
+
+    def insert_events(self, events):
+        if not events:
+            return
+
+        from pymongo.errors import BulkWriteError
+        self._ensure_indexes()
+
+        try:
+            # insert_many adds _id to the dicts it is given - keep the caller's copies clean
+            self.collection.insert_many([dict(e) for e in events], ordered=False)
+        except BulkWriteError as e:
+            # Duplicate event_ids are replays of events we already have
+            errors = e.details.get("writeErrors", [])
+            if any(err.get("code") != 11000 for err in errors):
+                raise
+
+    def find_events(self, employee_id, start, end):
+        return list(self.collection.find({
+            "employee_id": employee_id,
+            "timestamp": {"$gte": start, "$lt": end}
+        }, {"_id": 0}).sort("timestamp", 1))
+
+    def employee_ids(self, start, end):
+        return sorted(self.collection.distinct(
+            "employee_id", {"timestamp": {"$gte": start, "$lt": end}}
+        ))
+
+    def oldest_timestamp(self):
+        oldest = self.collection.find_one({}, {"timestamp": 1}, sort=[("timestamp", 1)])
+        return oldest["timestamp"] if oldest else None
+
+    def delete_events(self, employee_id, start, end, event_ids=None):
+        query = {
+            "employee_id": employee_id,
+            "timestamp": {"$gte": start, "$lt": end}
+        }
+        if event_ids is not None:
+            # $in with None also matches documents without an event_id (legacy)
+            query["event_id"] = {"$in": list(event_ids) + [None]}
+        result = self.collection.delete_many(query)
+        return result.deleted_count
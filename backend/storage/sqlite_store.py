@@ -0,0 +1,185 @@
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+from backend.storage.base import EventStore
+
+CORE_FIELDS = ("event_id", "employee_id", "event_type", "status", "timestamp")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    event_id TEXT,
+    employee_id TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    ts REAL NOT NULL,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_events_employee_ts ON events (employee_id, ts);
+"""
+
+# Client-generated IDs make replays idempotent; NULLs (legacy rows) never conflict
+EVENT_ID_INDEX = "CREATE UNIQUE INDEX IF NOT EXISTS idx_events_event_id ON events (event_id)"
+
+
+class SQLiteEventStore(EventStore):
+    """
+    Embedded event store for edge nodes - no database server needed.
+    Runs in WAL mode and groups writes into batched transactions,
+    flushed when batch_size events are pending or flush_interval passes.
+    """
+
+    def __init__(self, path, batch_size=100, flush_interval=1.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        if path != ":memory:" and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # One shared connection - Flask threads and the detector go through the lock
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+        self.conn.commit()
+
+        self.lock = threading.Lock()
+        self.pending = []
+        self.last_flush = time.time()
+
+        # Background flush so a quiet period never leaves events only in memory
+        self.flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        self.flusher.start()
+
+        atexit.register(self.close)
+
+    def _migrate(self):
+        """Bring databases created before event IDs up to date"""
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(events)")]
+        if "event_id" not in columns:
+            self.conn.execute("ALTER TABLE events ADD COLUMN event_id TEXT")
+        self.conn.execute(EVENT_ID_INDEX)
+
+    def _flush_loop(self):
+        while self.conn is not None:
+            time.sleep(self.flush_interval)
+            self.flush()
+
+    @staticmethod
+    def _to_row(event):
+        extra = {k: v for k, v in event.items() if k not in CORE_FIELDS and k != "_id"}
+        return (
+            event.get("event_id"),
+            event["employee_id"],
+            event["event_type"],
+            event["status"],
+            event["timestamp"].timestamp(),
+            json.dumps(extra, default=str) if extra else None,
+        )
+
+    @staticmethod
+    def _from_row(row):
+        event_id, employee_id, event_type, status, ts, extra = row
+        event = {
+            "employee_id": employee_id,
+            "event_type": event_type,
+            "status": status,
+            "timestamp": datetime.fromtimestamp(ts),
+        }
+        if event_id:
+            event["event_id"] = event_id
+        if extra:
+            event.update(json.loads(extra))
+        return event
+
+    def _flush_locked(self):
+        if not self.pending:
+            return
+        with self.conn:  # One transaction for the whole batch
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO events "
+                "(event_id, employee_id, event_type, status, ts, extra) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                self.pending
+            )
+        self.pending = []
+        self.last_flush = time.time()
+
+    def insert_event(self, event):
+        self.insert_events([event])
+
+    def insert_events(self, events):
+        rows = [self._to_row(e) for e in events]
+        with self.lock:
+            self.pending.extend(rows)
+            if (len(self.pending) >= self.batch_size
+                    or time.time() - self.last_flush >= self.flush_interval):
+                self._flush_locked()
+
+    def find_events(self, employee_id, start, end):
+        with self.lock:
+            # Reads must see buffered writes
+            self._flush_locked()
+            rows = self.conn.execute(
+                "SELECT event_id, employee_id, event_type, status, ts, extra FROM events "
+                "WHERE employee_id = ? AND ts >= ? AND ts < ? ORDER BY ts, id",
+                (employee_id, start.timestamp(), end.timestamp())
+            ).fetchall()
+        return [self._from_row(r) for r in rows]
+
+    def employee_ids(self, start, end):
+        with self.lock:
+            self._flush_locked()
+            rows = self.conn.execute(
+                "SELECT DISTINCT employee_id FROM events WHERE ts >= ? AND ts < ?",
+                (start.timestamp(), end.timestamp())
+            ).fetchall()
+        return sorted(r[0] for r in rows)
+
+    def oldest_timestamp(self):
+        with self.lock:
+            self._flush_locked()
+            row = self.conn.execute("SELECT MIN(ts) FROM events").fetchone()
+        return datetime.fromtimestamp(row[0]) if row[0] is not None else None
+
+    def delete_events(self, employee_id, start, end, event_ids=None):
+        where = "employee_id = ? AND ts >= ? AND ts < ?"
+        params = (employee_id, start.timestamp(), end.timestamp())
+
+        with self.lock:
+            self._flush_locked()
+            with self.conn:
+                if event_ids is None:
+                    return self.conn.execute(f"DELETE FROM events WHERE {where}", params).rowcount
+
+                removed = self.conn.execute(
+                    f"DELETE FROM events WHERE {where} AND event_id IS NULL", params
+                ).rowcount
+                event_ids = list(event_ids)
+                for i in range(0, len(event_ids), 500):  # Stay under SQLite's bound-variable limit
+                    chunk = event_ids[i:i + 500]
+                    removed += self.conn.execute(
+                        f"DELETE FROM events WHERE {where} AND event_id IN ({','.join('?' * len(chunk))})",
+                        params + tuple(chunk)
+                    ).rowcount
+        return removed
+
+    def flush(self):
+        with self.lock:
+            if self.conn is not None:
+                self._flush_locked()
+
+    def close(self):
+        with self.lock:
+            if self.conn is None:
+                return
+            self._flush_locked()
+            self.conn.close()
+            self.conn = None
@@ -0,0 +1,10 @@
+from datetime import datetime, timedelta
+
+
+def day_bounds(day=None):
+    """Return (start, end) datetimes covering a whole day (default: today)"""
+    if day is None:
+        day = datetime.now().date()
+
+    start = datetime(day.year, day.month, day.day)
+    return start, start + timedelta(days=1)
@@ -3,83 +3,111 @@ import { api } from "../api/api";
 import { socket } from "../api/socket";
 import { LineChart, Line, XAxis, YAxis, Tooltip } from "recharts";
 
-interface TimelineEvent {
-  event_type: string;
-  status: string;
-  timestamp: string;
+// Columnar intervals from /timeline: offsets in seconds from range_start
+interface TypeIntervals {
+  start: number[];
+  end: number[];
+  open: boolean;
 }
 
+interface Timeline {
+  range_start: string;
+  range_end: string;
+  resolution: number;
+  types: Record<string, TypeIntervals>;
+}
+
+interface Point {
+  t: number;
+  value: number | null;
+}
+
+const LEVELS: Record<string, number> = { phone: 3, sleep: 2, away: 1 };
+const COLORS: Record<string, string> = { phone: "#ffaa00", sleep: "#ff0000", away: "#0066ff" };
+
+// Each interval becomes a flat segment at its type's level, with a gap after it
+const toPoints = (intervals: TypeIntervals, level: number): Point[] => {
+  const points: Point[] = [];
+  intervals.start.forEach((start, i) => {
+    points.push({ t: start, value: level });
+    points.push({ t: intervals.end[i], value: level });
+    points.push({ t: intervals.end[i], value: null });
+  });
+  return points;
+};
+
+const formatOffset = (rangeStart: string, offset: number) => {
+  const date = new Date(new Date(rangeStart).getTime() + offset * 1000);
+  return date.toLocaleTimeString([], { hour: "2-digit", minute: "2-digit" });
+};
+
 const TimelineChart = () => {
-  const [events, setEvents] = useState<TimelineEvent[]>([]);
+  const [timeline, setTimeline] = useState<Timeline | null>(null);
 
-  // Load previous events from DB when page loads
-  useEffect(() => {
-    api.get("/events/today/001").then((res) => {
-      const data = Array.isArray(res.data) ? res.data : [];
-      setEvents(data);
+  const loadTimeline = () => {
+    api.get("/timeline/001?range=day").then((res) => {
+      setTimeline(res.data);
     });
+  };
+
+  // Load merged intervals when page loads
+  useEffect(() => {
+    loadTimeline();
   }, []);
 
-  // Real-time WebSocket updates
+  // Refresh on the backend's batched status updates
   useEffect(() => {
-    socket.on("status_update", (data: any) => {
-      const timelineEvent: TimelineEvent = {
-        event_type: data.event_type,
-        status: data.active ? "start" : "end",
-        timestamp: data.timestamp,
-      };
-
-      setEvents((prev) => [...prev, timelineEvent]);
-    });
+    socket.on("status_batch_update", loadTimeline);
 
     return () => {
-      socket.off("status_update");
+      socket.off("status_batch_update", loadTimeline);
     };
   }, []);
 
-  // Convert events to graph-friendly format
-  const chartData = events.map((e, index) => ({
-    name: index,
-    value:
-      e.event_type === "phone"
-        ? 3
-        : e.event_type === "sleep"
-        ? 2
-        : e.event_type === "away"
-        ? 1
-        : 0,
-    status: e.status,
-    timestamp: e.timestamp,
-  }));
+  const hasActivity =
+    timeline !== null &&
+    Object.values(timeline.types).some((intervals) => intervals.start.length > 0);
 
   return (
     <div className="card">
-      <h2>Timeline (Real-Time Events)</h2>
-
-      <LineChart width={600} height={300} data={chartData}>
-        <XAxis dataKey="name" />
-        <YAxis
-          domain={[0, 3]}
-          ticks={[0, 1, 2, 3]}
-          tickFormatter={(tick) =>
-            tick === 3 ? "Phone" : tick === 2 ? "Sleep" : tick === 1 ? "Away" : ""
-          }
-        />
-        <Tooltip
-          formatter={(value: number, _name: string, props: any) => {
-            const evt = events[props.payload.name];
-            return [
-              evt.event_type.toUpperCase() +
-                " " +
-                (evt.status === "start" ? "START" : "END"),
-              "Event",
-            ];
-          }}
-        />
-        <Line type="monotone" dataKey="value" stroke="#ff0000" strokeWidth={2} />
-      </LineChart>
-
-      {events.length === 0 && <p>No activity recorded yet today.</p>}
+      <h2>Timeline (Today)</h2>
+
+      {timeline && (
+        <LineChart width={600} height={300}>
+          <XAxis
+            dataKey="t"
+            type="number"
+            domain={["dataMin", "dataMax"]}
+            tickFormatter={(offset) => formatOffset(timeline.range_start, offset)}
+          />
+          <YAxis
+            domain={[0, 3]}
+            ticks={[0, 1, 2, 3]}
+            tickFormatter={(tick) =>
+              tick === 3 ? "Phone" : tick === 2 ? "Sleep" : tick === 1 ? "Away" : ""
+            }
+          />
+          <Tooltip
+            labelFormatter={(offset: number) => formatOffset(timeline.range_start, offset)}
+            formatter={(_value: number, name: string) => [name.toUpperCase(), "Event"]}
+          />
+          {Object.entries(timeline.types).map(([eventType, intervals]) => (
+            <Line
+              key={eventType}
+              name={eventType}
+              data={toPoints(intervals, LEVELS[eventType] ?? 0)}
+              dataKey="value"
+              stroke={COLORS[eventType] ?? "#999999"}
+              strokeWidth={4}
+              dot={false}
+              connectNulls={false}
+              isAnimationActive={false}
+            />
+          ))}
+        </LineChart>
+      )}
+
+      {!hasActivity && <p>No activity recorded yet today.</p>}
     </div>
   );
 };
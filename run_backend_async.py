@@ -0,0 +1,43 @@
+"""
+Run the Flask backend with SocketIO on gevent (production serving mode)
+
+Every dashboard socket and HTTP poll is a greenlet instead of an OS thread,
+and PyMongo cooperates with gevent, so database waits don't hold threads.
+Requires: pip install gevent gevent-websocket
+"""
+from gevent import monkey
+
+# Must patch before anything imports socket/threading
+monkey.patch_all()
+
+import os
+
+os.environ.setdefault("SOCKETIO_ASYNC_MODE", "gevent")
+
+from gevent.pool import Pool
+
+from backend.app import app, socketio
+import backend.socket_instance as socket_instance
+
+# Cap on concurrent connections - beyond this, new clients wait to be accepted
+MAX_CONNECTIONS = int(os.environ.get("MAX_CONNECTIONS", "10000"))
+
+# Initialize the global socketio instance
+socket_instance.init_socketio(socketio)
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("🚀 Starting Employee Monitoring Backend (gevent)")
+    print("📡 Server: http://127.0.0.1:5000")
+    print(f"🔌 WebSocket: Enabled (up to {MAX_CONNECTIONS} connections)")
+    print("=" * 50)
+
+    socketio.run(
+        app,
+        debug=False,
+        port=5000,
+        host='0.0.0.0',
+        use_reloader=False,
+        log_output=False,
+        spawn=Pool(MAX_CONNECTIONS)
+    )
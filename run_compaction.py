@@ -0,0 +1,32 @@
+"""
+Compact old event history into columnar archives
+
+Run periodically (e.g. nightly from cron). Days older than RETENTION_DAYS
+move from the event store into per-employee/per-day NumPy archives under
+ARCHIVE_DIR; reads through the backend keep seeing them.
+"""
+import time
+
+from backend.config import ARCHIVE_DIR, RETENTION_DAYS
+from backend.storage import create_event_store
+from backend.storage.archive import EventArchive
+from backend.services.compactor import EventCompactor
+
+if __name__ == "__main__":
+    print("=" * 50)
+    print("🗜️  Compacting event history")
+    print(f"📁 Archive: {ARCHIVE_DIR}")
+    print(f"📅 Keeping last {RETENTION_DAYS} days in the event store")
+    print("=" * 50)
+
+    store = create_event_store()
+    compactor = EventCompactor(store, EventArchive(ARCHIVE_DIR), RETENTION_DAYS)
+
+    started = time.time()
+    stats = compactor.run()
+    store.close()
+
+    print(f"✅ Archived {stats['events']} events over {stats['days']} employee-days "
+          f"({stats['archived_bytes'] / 1024:.1f} KB) in {time.time() - started:.1f}s")
+    if stats["skipped"]:
+        print(f"⚠️  Skipped {stats['skipped']} employee-days with IDs that can't be archived")
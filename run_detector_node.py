@@ -0,0 +1,38 @@
+"""
+Detector-only node: runs AI detection without the Flask backend
+
+Meant for EVENT_STORE=http, where events are shipped to a central backend
+(EVENT_BACKEND_URL) instead of being served from this machine.
+Pass --no-camera to run without the preview window.
+"""
+import sys
+
+from backend.config import EVENT_STORE, EVENT_BACKEND_URL
+from ai_engine.detector import DetectionRunner
+
+if __name__ == "__main__":
+    show_camera = "--no-camera" not in sys.argv
+
+    print("=" * 50)
+    print("🚀 Starting Detector Node")
+    if EVENT_STORE == "http":
+        print(f"📡 Shipping events to: {EVENT_BACKEND_URL}")
+    else:
+        print(f"💾 Event store: {EVENT_STORE}")
+    print(f"🎥 Camera Preview: {'Enabled' if show_camera else 'Disabled'}")
+    print("=" * 50)
+
+    detector = DetectionRunner(show_preview=show_camera)
+    detector.start()
+    if not detector.running:
+        sys.exit(1)
+
+    try:
+        if show_camera:
+            detector.run_loop()
+        else:
+            detector.run_headless()
+    except KeyboardInterrupt:
+        print("\n\n🛑 Shutting down...")
+    finally:
+        detector.stop()
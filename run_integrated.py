@@ -9,6 +9,7 @@ import threading
 # Import Flask app and socketio
 from backend.app import app, socketio
 import backend.socket_instance as socket_instance
+import backend.detector_instance as detector_instance
 
 # Import detector
 from ai_engine.detector import DetectionRunner
@@ -51,6 +52,7 @@ def start_backend_with_camera():
     print("⏳ Initializing AI Engine with Camera...")
     detector = DetectionRunner(show_preview=True)
     detector.start()
+    detector_instance.init_detector(detector)
     time.sleep(1)
 
     print("✅ AI Engine running with camera preview\n")
@@ -91,6 +93,7 @@ def start_backend_headless():
     print("\n⏳ Initializing AI Engine...")
     detector = DetectionRunner(show_preview=False)
     detector.start()
+    detector_instance.init_detector(detector)
 
     detection_thread = threading.Thread(target=detector.run_headless, daemon=True)
     detection_thread.start()
@@ -0,0 +1,271 @@
+"""
+Backend load generator and route benchmark
+
+Seeds an event store with synthetic start/end streams for many employees
+and days, then drives the Flask routes and Socket.IO broadcasts at a given
+concurrency and reports throughput, latency percentiles and store query
+counts. Runs fully offline: routes go through Flask's test client and the
+default store is an embedded SQLite file.
+
+Example:
+    python run_load_test.py --employees 500 --days 90 --concurrency 16
+"""
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from backend.models.event_model import EVENT_TYPES
+from backend.storage import create_event_store, set_event_store
+from backend.storage.base import EventStore
+
+# Mean episode length in minutes per event type
+EPISODE_MINUTES = {"sleep": 5, "phone": 2, "away": 10}
+WORK_START_HOUR = 8
+WORK_HOURS = 12
+
+
+class CountingEventStore(EventStore):
+    """Wraps a store and counts the calls routes make against it"""
+
+    def __init__(self, store):
+        self.store = store
+        self.lock = threading.Lock()
+        self.counts = {"find_events": 0, "insert_events": 0}
+
+    def _count(self, name):
+        with self.lock:
+            self.counts[name] += 1
+
+    def insert_event(self, event):
+        self.insert_events([event])
+
+    def insert_events(self, events):
+        self._count("insert_events")
+        self.store.insert_events(events)
+
+    def find_events(self, employee_id, start, end):
+        self._count("find_events")
+        return self.store.find_events(employee_id, start, end)
+
+    def flush(self):
+        self.store.flush()
+
+    def close(self):
+        self.store.close()
+
+    def reset(self):
+        with self.lock:
+            for name in self.counts:
+                self.counts[name] = 0
+
+
+def employee_ids(count):
+    return [f"{i:03d}" for i in range(1, count + 1)]
+
+
+def generate_day(rng, employee_id, day_start, rate_per_hour):
+    """Synthetic non-overlapping start/end pairs for each event type in one work day"""
+    events = []
+    work_start = day_start + timedelta(hours=WORK_START_HOUR)
+    work_seconds = WORK_HOURS * 3600
+
+    for event_type in EVENT_TYPES:
+        # Poisson number of episodes over the work day
+        episodes = 0
+        t = rng.expovariate(rate_per_hour)
+        while t < WORK_HOURS:
+            episodes += 1
+            t += rng.expovariate(rate_per_hour)
+
+        starts = sorted(rng.uniform(0, work_seconds) for _ in range(episodes))
+        busy_until = 0.0
+        for offset in starts:
+            if offset < busy_until:
+                continue
+            duration = rng.expovariate(1.0 / (EPISODE_MINUTES[event_type] * 60))
+            end = min(offset + max(duration, 1.0), work_seconds)
+            busy_until = end
+
+            for status, at in (("start", offset), ("end", end)):
+                events.append({
+                    "event_id": uuid.uuid4().hex,
+                    "employee_id": employee_id,
+                    "event_type": event_type,
+                    "status": status,
+                    "timestamp": work_start + timedelta(seconds=at)
+                })
+
+    return events
+
+
+def seed(store, employees, days, rate_per_hour, seed_value=42):
+    """Fill the store with days of history ending today. Returns event count"""
+    rng = random.Random(seed_value)
+    today = datetime.now().date()
+    first_day = datetime(today.year, today.month, today.day) - timedelta(days=days - 1)
+
+    total = 0
+    started = time.perf_counter()
+
+    for day in range(days):
+        day_start = first_day + timedelta(days=day)
+        batch = []
+        for employee_id in employee_ids(employees):
+            batch.extend(generate_day(rng, employee_id, day_start, rate_per_hour))
+
+        store.insert_events(batch)
+        total += len(batch)
+        print(f"   Day {day + 1}/{days}: {total} events", end="\r")
+
+    store.flush()
+    elapsed = time.perf_counter() - started
+    print(f"\n✅ Seeded {total} events in {elapsed:.1f}s ({total / max(elapsed, 1e-9):.0f} events/s)")
+    return total
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(round(pct / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def bench_route(app, counter, path_template, employees, requests, concurrency):
+    """Hit one route with random employees. Returns a result dict"""
+    ids = employee_ids(employees)
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    local = threading.local()
+
+    def one_request(i):
+        client = getattr(local, "client", None)
+        if client is None:
+            client = local.client = app.test_client()
+
+        path = path_template.format(employee_id=ids[i % len(ids)])
+        started = time.perf_counter()
+        resp = client.get(path)
+        elapsed = time.perf_counter() - started
+
+        with lock:
+            latencies.append(elapsed)
+            if resp.status_code != 200:
+                errors[0] += 1
+
+    counter.reset()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one_request, range(requests)))
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "route": path_template,
+        "requests": requests,
+        "errors": errors[0],
+        "rps": requests / wall,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "queries_per_request": counter.counts["find_events"] / max(requests, 1),
+    }
+
+
+def bench_socketio(app, socketio, clients, broadcasts):
+    """Connect test clients and time broadcasts of the dashboard status event"""
+    started = time.perf_counter()
+    connected = [socketio.test_client(app) for _ in range(clients)]
+    connect_time = time.perf_counter() - started
+
+    data = {"sleep": False, "phone": True, "away": False, "timestamp": datetime.now().isoformat()}
+    latencies = []
+    for _ in range(broadcasts):
+        started = time.perf_counter()
+        socketio.emit("status_batch_update", data)
+        latencies.append(time.perf_counter() - started)
+
+    received = sum(
+        sum(1 for msg in c.get_received() if msg["name"] == "status_batch_update")
+        for c in connected
+    )
+    for c in connected:
+        c.disconnect()
+
+    latencies.sort()
+    return {
+        "clients": clients,
+        "connect_ms_per_client": connect_time / max(clients, 1) * 1000,
+        "broadcast_p50_ms": percentile(latencies, 50) * 1000,
+        "broadcast_p99_ms": percentile(latencies, 99) * 1000,
+        "delivered": received,
+        "expected": clients * broadcasts,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed synthetic events and benchmark backend routes")
+    parser.add_argument("--employees", type=int, default=50)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--rate", type=float, default=2.0, help="episodes per hour per event type")
+    parser.add_argument("--store", choices=["sqlite", "mongo"], default="sqlite")
+    parser.add_argument("--db", default=None, help="SQLite path (default: temporary file)")
+    parser.add_argument("--skip-seed", action="store_true", help="reuse an already seeded store")
+    parser.add_argument("--requests", type=int, default=500, help="requests per route")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--socket-clients", type=int, default=100)
+    parser.add_argument("--broadcasts", type=int, default=20)
+    args = parser.parse_args()
+
+    db_path = args.db
+    if args.store == "sqlite" and db_path is None:
+        db_path = os.path.join(tempfile.mkdtemp(prefix="ems-load-"), "events.db")
+
+    store = create_event_store(args.store, db_path)
+    counter = CountingEventStore(store)
+    set_event_store(counter)
+
+    # Imported after the store is installed so every route uses it
+    from backend.app import app, socketio
+
+    print("=" * 60)
+    print("📊 Employee Monitoring Load Test")
+    print(f"🗄️  Store: {args.store}" + (f" ({db_path})" if db_path else ""))
+    print(f"👥 Employees: {args.employees} | Days: {args.days} | Rate: {args.rate}/h")
+    print("=" * 60)
+
+    if not args.skip_seed:
+        seed(counter, args.employees, args.days, args.rate)
+
+    routes = [
+        "/events/today/{employee_id}",
+        "/events/live/{employee_id}",
+        "/summary/today/{employee_id}",
+        "/timeline/{employee_id}?range=day",
+        "/timeline/{employee_id}?range=week",
+    ]
+
+    print(f"\n{'route':40} {'rps':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'q/req':>6} {'err':>4}")
+    for route in routes:
+        r = bench_route(app, counter, route, args.employees, args.requests, args.concurrency)
+        print(f"{r['route']:40} {r['rps']:8.0f} {r['p50_ms']:8.2f} {r['p95_ms']:8.2f} "
+              f"{r['p99_ms']:8.2f} {r['queries_per_request']:6.1f} {r['errors']:4d}")
+
+    if args.socket_clients:
+        s = bench_socketio(app, socketio, args.socket_clients, args.broadcasts)
+        print(f"\n🔌 Socket.IO: {s['clients']} clients, "
+              f"connect {s['connect_ms_per_client']:.2f} ms/client, "
+              f"broadcast p50 {s['broadcast_p50_ms']:.2f} ms / p99 {s['broadcast_p99_ms']:.2f} ms, "
+              f"delivered {s['delivered']}/{s['expected']}")
+
+    counter.close()
+
+
+if __name__ == "__main__":
+    main()